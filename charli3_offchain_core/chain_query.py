@@ -1,7 +1,10 @@
 """ This module contains the ChainQuery class, which is used to query the blockchain."""
 
 import asyncio
+import copy
+import os
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from typing import List, Literal, Mapping, Optional, Tuple, Union
 
@@ -29,7 +32,7 @@ from pycardano import (
     plutus_script_hash,
 )
 
-from charli3_offchain_core.datums import NodeDatum
+from charli3_offchain_core.oracle_checks import decode_node_datum
 from charli3_offchain_core.utils.exceptions import CollateralException
 from charli3_offchain_core.utils.logging_config import logging
 
@@ -88,6 +91,11 @@ class UnknownNetworkMagic(Exception):
     pass
 
 
+def _copy_utxos(utxos: List[UTxO]) -> List[UTxO]:
+    """Copy UTxOs down to their outputs, sharing the values and datums."""
+    return [UTxO(utxo.input, copy.copy(utxo.output)) for utxo in utxos]
+
+
 class ChainQuery:
     """chainQuery methods"""
 
@@ -97,6 +105,8 @@ class ChainQuery:
         kupo_ogmios_context: KupoOgmiosV6ChainContext = None,
         oracle_address: Optional[str] = None,
         use_slot_time: bool = False,
+        utxo_cache_ttl_ms: int = 0,
+        script_cache_dir: Optional[str] = None,
     ):
         if blockfrost_context is None and kupo_ogmios_context is None:
             raise ValueError("At least one of the chain contexts must be provided.")
@@ -108,6 +118,15 @@ class ChainQuery:
         self.use_slot_time = use_slot_time
 
         self._datum_cache = {}
+        self._script_cache: dict = {}
+        # Optional directory keeping fetched scripts across runs, by hash.
+        self.script_cache_dir = script_cache_dir
+        # Recent UTxO queries by address, as (monotonic time in ms, utxos).
+        # Off by default, a positive TTL opts in.
+        self.utxo_cache_ttl_ms = utxo_cache_ttl_ms
+        self._utxo_cache: dict = {}
+        # Confirmation tasks of submit_tx_async, referenced until they finish.
+        self._confirmation_tasks: set = set()
 
     @property
     def genesis_params(self) -> GenesisParameters:
@@ -142,7 +161,7 @@ class ChainQuery:
             return slot_config.zero_time + ms_after_origin
 
         else:
-            return round(time.time_ns() * 1e-6)
+            return time.time_ns() // 1_000_000
 
     async def get_metadata_cbor(
         self, tx_id: TransactionId, slot: Optional[int]
@@ -175,30 +194,45 @@ class ChainQuery:
 
     def _get_datum(self, utxo):
         """get datum for UTxO"""
-        if utxo.output.datum_hash is not None:
-            datum = self.context.api.script_datum_cbor(str(utxo.output.datum_hash)).cbor
-            return datum
-        return None
+        if utxo.output.datum_hash is None:
+            return None
+        # A datum never changes for a given hash, so it is fetched only once.
+        datum_hash = str(utxo.output.datum_hash)
+        datum = self._datum_cache.get(datum_hash)
+        if datum is None:
+            datum = self.context.api.script_datum_cbor(datum_hash).cbor
+            self._datum_cache[datum_hash] = datum
+        return datum
+
+    def _get_datums(self, utxos: List[UTxO]) -> List[Optional[bytes]]:
+        """get datums for UTxOs, fetching them concurrently"""
+        if len(utxos) <= 1:
+            return [self._get_datum(utxo) for utxo in utxos]
+        with ThreadPoolExecutor(max_workers=min(16, len(utxos))) as pool:
+            return list(pool.map(self._get_datum, utxos))
 
     def get_datums_for_utxo(self, utxos):
         """insert datum for UTxOs"""
-        result = []
-        if len(utxos) > 0:
-            for utxo in utxos:
-                datum = self._get_datum(utxo)
-                result.append(datum)
-        return result
+        return self._get_datums(utxos)
 
     def get_node_datums_with_utxo(self, utxos: List[UTxO]) -> List[UTxO]:
         """insert datum for UTxOs"""
         result: List[UTxO] = []
-        if len(utxos) > 0:
-            for utxo in utxos:
-                if utxo.output.amount.multi_asset:
-                    datum = self._get_datum(utxo)
-                    if datum:
-                        utxo.output.datum = NodeDatum.from_cbor(datum)
-                    result.append(utxo)
+        hashed: List[UTxO] = []
+        for utxo in utxos:
+            if not utxo.output.amount.multi_asset:
+                continue
+            # Inline datums are already local, only hashed datums need a fetch.
+            if utxo.output.datum is not None:
+                if isinstance(utxo.output.datum, RawCBOR):
+                    utxo.output.datum = decode_node_datum(utxo.output.datum.cbor)
+            elif utxo.output.datum_hash is not None:
+                hashed.append(utxo)
+            result.append(utxo)
+
+        for utxo, datum in zip(hashed, self._get_datums(hashed)):
+            if datum:
+                utxo.output.datum = decode_node_datum(datum)
         return result
 
     async def get_address_balance(self, address: Address) -> int:
@@ -249,11 +283,24 @@ class ChainQuery:
             PlutusV2Script: plutus script if script hash matches else None
 
         """
+        # A script never changes for a given hash, so it is fetched only once.
+        if scripthash in self._script_cache:
+            return self._script_cache[scripthash]
+
+        plutus_script = self._read_script_from_disk(scripthash)
+        if plutus_script is not None:
+            self._script_cache[scripthash] = plutus_script
+            return plutus_script
+
         if isinstance(self.context, BlockFrostChainContext):
-            plutus_script = self.context._get_script(str(scripthash))
+            plutus_script = await asyncio.to_thread(
+                self.context._get_script, str(scripthash)
+            )
             if plutus_script_hash(plutus_script) != scripthash:
                 plutus_script = PlutusV2Script(cbor2.dumps(plutus_script))
             if plutus_script_hash(plutus_script) == scripthash:
+                self._script_cache[scripthash] = plutus_script
+                self._write_script_to_disk(scripthash, plutus_script)
                 return plutus_script
 
             logger.error("script hash mismatch")
@@ -262,10 +309,59 @@ class ChainQuery:
             logger.error("ogmios context does not support get_script")
             return None
 
+    def _script_cache_path(self, scripthash: ScriptHash) -> Optional[str]:
+        """Path of a script in the on-disk cache, None if it is disabled."""
+        if not self.script_cache_dir:
+            return None
+        return os.path.join(self.script_cache_dir, f"{scripthash}.plutus")
+
+    def _read_script_from_disk(
+        self, scripthash: ScriptHash
+    ) -> Optional[PlutusV2Script]:
+        """Load a cached script, ignoring files whose hash does not match."""
+        path = self._script_cache_path(scripthash)
+        if path is None or not os.path.isfile(path):
+            return None
+        try:
+            with open(path, "rb") as script_file:
+                plutus_script = PlutusV2Script(script_file.read())
+        except OSError as err:
+            logger.warning("could not read cached script %s: %s", path, err)
+            return None
+        if plutus_script_hash(plutus_script) != scripthash:
+            logger.warning("ignoring cached script with wrong hash: %s", path)
+            return None
+        return plutus_script
+
+    def _write_script_to_disk(
+        self, scripthash: ScriptHash, plutus_script: PlutusV2Script
+    ) -> None:
+        """Store a verified script in the on-disk cache, if enabled."""
+        path = self._script_cache_path(scripthash)
+        if path is None:
+            return
+        try:
+            os.makedirs(self.script_cache_dir, exist_ok=True)
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            with open(tmp_path, "wb") as script_file:
+                script_file.write(bytes(plutus_script))
+            os.replace(tmp_path, path)
+        except OSError as err:
+            logger.warning("could not cache script %s: %s", path, err)
+
     async def get_utxos(self, address: Union[str, Address, None] = None) -> List[UTxO]:
         """
         get utxos from oracle address.
 
+        When utxo_cache_ttl_ms is set, results are reused for that long, so
+        back-to-back calls (e.g. a node update followed by an aggregation)
+        query the chain only once. The cache is cleared whenever a transaction
+        is submitted, also by a staged_submitter sharing it. Every call gets
+        its own UTxO and output objects, so datums decoded onto (or replaced
+        in) the returned UTxOs never leak into the cache. The blocking query
+        runs in a worker thread so that several lookups can be awaited
+        concurrently.
+
         Args:
             address (str, Address, optional): The address to get the utxos from. Defaults to None.
 
@@ -274,12 +370,64 @@ class ChainQuery:
         """
         if address is None:
             address = self.oracle_address
+        address = str(address)
+        now_ms = time.monotonic_ns() // 1_000_000
+        cached = self._utxo_cache.get(address)
+        if cached is not None and now_ms - cached[0] < self.utxo_cache_ttl_ms:
+            return _copy_utxos(cached[1])
+
         if self.blockfrost_context is not None:
             logger.info("Getting utxos from blockfrost")
-            return self.blockfrost_context.utxos(str(address))
-        if self.ogmios_context is not None:
+            utxos = await asyncio.to_thread(self.blockfrost_context.utxos, address)
+        elif self.ogmios_context is not None:
             logger.info("Getting utxos from ogmios")
-            return self.ogmios_context.utxos(str(address))
+            utxos = await asyncio.to_thread(self.ogmios_context.utxos, address)
+        else:
+            return None
+        if self.utxo_cache_ttl_ms > 0:
+            self._utxo_cache[address] = (now_ms, utxos)
+            return _copy_utxos(utxos)
+        return utxos
+
+    def staged_submitter(
+        self, oracle_address: Optional[str] = None
+    ) -> "StagedTxSubmitter":
+        """
+        StagedTxSubmitter over the same chain contexts, sharing this query's caches.
+
+        A transaction submitted through either of them clears the cached utxos
+        of both, so neither builds on outputs the other has just spent.
+
+        Args:
+            oracle_address (str, optional): oracle address of the submitter.
+
+        Returns:
+            StagedTxSubmitter: the staged submitter.
+        """
+        submitter = StagedTxSubmitter(
+            self.blockfrost_context,
+            self.ogmios_context,
+            oracle_address,
+            utxo_cache_ttl_ms=self.utxo_cache_ttl_ms,
+            script_cache_dir=self.script_cache_dir,
+        )
+        submitter._utxo_cache = self._utxo_cache
+        submitter._script_cache = self._script_cache
+        submitter._datum_cache = self._datum_cache
+        return submitter
+
+    def invalidate_utxo_cache(self, address: Union[str, Address, None] = None) -> None:
+        """
+        Drop cached utxos so the next get_utxos call queries the chain.
+
+        Args:
+            address (str, Address, optional): Only drop the utxos of this
+            address. Defaults to None, which drops every cached address.
+        """
+        if address is None:
+            self._utxo_cache.clear()
+        else:
+            self._utxo_cache.pop(str(address), None)
 
     async def process_common_inputs(
         self,
@@ -351,7 +499,10 @@ class ChainQuery:
         non_nft_utxo = await self.find_collateral(address, collateral_amount)
 
         if non_nft_utxo is None:
-            await self.create_collateral(address, signing_key, collateral_amount)
+            non_nft_utxo = await self.create_collateral(
+                address, signing_key, collateral_amount
+            )
+        if non_nft_utxo is None:
             non_nft_utxo = await self.find_collateral(address, collateral_amount)
 
         return non_nft_utxo
@@ -375,7 +526,10 @@ class ChainQuery:
 
         if non_nft_utxo is None:
             # We reuse the create_collater because it has the same principle
-            await self.create_collateral(address, signing_key, required_amount)
+            non_nft_utxo = await self.create_collateral(
+                address, signing_key, required_amount
+            )
+        if non_nft_utxo is None:
             non_nft_utxo = await self.find_collateral(address, required_amount)
 
         return non_nft_utxo
@@ -405,12 +559,15 @@ class ChainQuery:
         """
         try:
             utxos = await self.get_utxos(address=target_address)
+            # Compare plain lovelace amounts, an ada-only Value compared with
+            # an int would be converted to a new Value for every UTxO.
+            min_coin = required_amount - 1000000
+            max_coin = required_amount + 10000000
             for utxo in utxos:
+                amount = utxo.output.amount
                 # A collateral should contain no multi asset
-                if not utxo.output.amount.multi_asset:
-                    if utxo.output.amount < (required_amount + 10000000):
-                        if utxo.output.amount.coin >= (required_amount - 1000000):
-                            return utxo
+                if not amount.multi_asset and min_coin <= amount.coin < max_coin:
+                    return utxo
         except ApiError as err:
             if err.status_code == 404:
                 logger.info("No utxos for tx fees found")
@@ -590,8 +747,17 @@ class ChainQuery:
         Returns:
             Tuple[str, Transaction]: The status of the transaction and the transaction object.
         """
+        self._submit_tx(tx)
+
+        status, _ = await self.wait_for_tx(str(tx.id))
+        return status, tx
+
+    def _submit_tx(self, tx: Transaction) -> None:
+        """Send a transaction to the chain without waiting for its confirmation."""
         logger.info("Submitting transaction: %s", str(tx.id))
         logger.debug("tx: %s", tx)
+        # The transaction spends some of the cached UTxOs.
+        self.invalidate_utxo_cache()
 
         if self.ogmios_context is not None:
             logger.info("Submitting tx with ogmios")
@@ -600,15 +766,79 @@ class ChainQuery:
             logger.info("Submitting tx with blockfrost")
             self.blockfrost_context.submit_tx(tx.to_cbor())
 
-        status, _ = await self.wait_for_tx(str(tx.id))
-        return status, tx
+    async def submit_tx_async(
+        self, tx: Transaction
+    ) -> "asyncio.Task[Tuple[str, Transaction]]":
+        """
+        Submits a transaction and returns immediately, leaving the confirmation
+        to a background task.
+
+        The caller can await the returned task when the confirmation status is
+        needed, or prepare the next transaction in the meantime. The task is
+        referenced by the ChainQuery until it finishes, and a failure that
+        nobody awaits is logged.
+
+        Note: the caller is responsible for UTxO chaining, two transactions
+        spending the same input must not be in flight at the same time.
+
+        Args:
+            tx: The transaction to submit.
+
+        Returns:
+            asyncio.Task[Tuple[str, Transaction]]: A task resolving to the status
+            of the transaction and the transaction object.
+        """
+        self._submit_tx(tx)
+
+        async def _confirm() -> Tuple[str, Transaction]:
+            status, _ = await self.wait_for_tx(str(tx.id))
+            return status, tx
+
+        task = asyncio.create_task(_confirm())
+        self._confirmation_tasks.add(task)
+        task.add_done_callback(self._confirmation_done)
+        return task
+
+    def _confirmation_done(self, task: asyncio.Task) -> None:
+        """Release a finished confirmation task, logging its failure if any."""
+        self._confirmation_tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.error("Transaction confirmation failed: %s", task.exception())
+
+    async def submit_many(
+        self, txs: List[Transaction]
+    ) -> List[Tuple[Union[str, Exception], Transaction]]:
+        """
+        Submits independent transactions and waits for their confirmations
+        concurrently.
+
+        A transaction that fails to submit or confirm gets the raised exception
+        in place of its status, the others are still submitted and awaited.
+
+        Note: the transactions must not spend the same inputs.
+
+        Args:
+            txs: The transactions to submit.
+
+        Returns:
+            List[Tuple[Union[str, Exception], Transaction]]: The status of each
+            transaction, or the exception it failed with, and the transaction
+            object, in the same order as ``txs``.
+        """
+        results = await asyncio.gather(
+            *(self.submit_tx_with_print(tx) for tx in txs), return_exceptions=True
+        )
+        return [
+            (result, tx) if isinstance(result, Exception) else result
+            for result, tx in zip(results, txs)
+        ]
 
     async def create_collateral(
         self,
         target_address: Union[str, Address],
         skey: Union[PaymentSigningKey, ExtendedSigningKey],
         required_amount: int,
-    ) -> None:
+    ) -> Optional[UTxO]:
         """
         This method creates a collateral utxo for the given address with the following requirements:
         - amount = 5000000 lovelaces
@@ -619,17 +849,19 @@ class ChainQuery:
             required_amount: The required ADA amount in the UTxO.
 
         Returns:
-            None
+            Optional[UTxO]: The created collateral utxo once the transaction is
+            confirmed, None otherwise.
         """
         logger.info("creating collateral UTxO.")
         collateral_builder = TransactionBuilder(self.context)
 
         collateral_builder.add_input_address(target_address)
-        collateral_builder.add_output(
-            TransactionOutput(target_address, required_amount)
-        )
+        collateral_output = TransactionOutput(target_address, required_amount)
+        collateral_builder.add_output(collateral_output)
+        # Added outputs keep their position, the change is appended after them.
+        collateral_index = len(collateral_builder.outputs) - 1
 
-        await self.submit_tx_with_print(
+        status, tx = await self.submit_tx_with_print(
             collateral_builder.build_and_sign(
                 [skey],
                 target_address,
@@ -637,6 +869,20 @@ class ChainQuery:
                 auto_ttl_offset=120,
             )
         )
+        if status != "success":
+            return None
+
+        # The new output is known from the transaction itself, no need to
+        # query the address again to find it. It is identified by its
+        # position, a change output may hold the same amount.
+        outputs = tx.transaction_body.outputs
+        if collateral_index >= len(outputs) or (
+            outputs[collateral_index] != collateral_output
+        ):
+            return None
+        return UTxO(
+            TransactionInput(tx.id, collateral_index), outputs[collateral_index]
+        )
 
 
 class StagedTxSubmitter(ChainQuery):
@@ -740,6 +986,6 @@ class StagedTxSubmitter(ChainQuery):
         except CollateralException as err:
             logger.error("Error submitting transaction: %s", err)
         except (InsufficientUTxOBalanceException, UTxOSelectionException) as exc:
-            print("Insufficient Funds in the wallet.", exc)
+            logger.error("Insufficient Funds in the wallet. %s", exc)
         except Exception as err:
             logger.error("Error submitting transaction: %s", err)
@@ -3,9 +3,13 @@
 from dataclasses import dataclass, field
 from typing import List, Optional, Union
 
+import cbor2
 from pycardano import PlutusData
 from pycardano.serialization import IndefiniteList
 
+# CBOR tag of a Plutus constructor with CONSTR_ID 0 (tags 121-127 map to 0-6)
+_CONSTR_TAG_BASE = 121
+
 
 @dataclass
 class DataFeed(PlutusData):
@@ -73,6 +77,99 @@ class NodeDatum(PlutusData):
     CONSTR_ID = 1
     node_state: NodeState
 
+    @classmethod
+    def fast_from_cbor(cls, raw: bytes) -> "NodeDatum":
+        """Decode a NodeDatum by unpacking its fixed on-chain layout directly.
+
+        Avoids the generic reflective PlutusData decoding, falling back to
+        from_cbor if the CBOR does not match the expected layout.
+        """
+        try:
+            datum = cbor2.loads(raw)
+            (node_state,) = _constr_fields(datum, cls.CONSTR_ID)
+            operator, feed = _constr_fields(node_state, NodeState.CONSTR_ID)
+            if feed.tag == _CONSTR_TAG_BASE + Nothing.CONSTR_ID:
+                ns_feed = Nothing()
+            else:
+                (data_feed,) = _constr_fields(feed, PriceFeed.CONSTR_ID)
+                value, last_update = _constr_fields(data_feed, DataFeed.CONSTR_ID)
+                ns_feed = PriceFeed(DataFeed(value, last_update))
+            if not isinstance(operator, bytes):
+                raise ValueError("Invalid node operator")
+        except (ValueError, TypeError, AttributeError):
+            return cls.from_cbor(raw)
+        return cls(NodeState(ns_operator=operator, ns_feed=ns_feed))
+
+    @classmethod
+    def peek_operator(cls, raw: bytes) -> Optional[bytes]:
+        """Read only the node operator from a NodeDatum's CBOR.
+
+        Returns None if the CBOR does not match the expected layout.
+        """
+        try:
+            (node_state,) = _constr_fields(cbor2.loads(raw), cls.CONSTR_ID)
+            operator = _constr_fields(node_state, NodeState.CONSTR_ID)[0]
+        except (ValueError, TypeError, AttributeError, IndexError):
+            return None
+        return operator if isinstance(operator, bytes) else None
+
+    def _has_known_layout(self) -> bool:
+        """Whether the fields match the layout written by to_primitive."""
+        state = self.node_state
+        feed = getattr(state, "ns_feed", None)
+        operator = getattr(state, "ns_operator", None)
+        if type(feed) is PriceFeed:
+            data_feed = feed.df
+            if type(data_feed) is not DataFeed or not (
+                type(data_feed.df_value) is int
+                and type(data_feed.df_last_update) is int
+            ):
+                return False
+        elif type(feed) is not Nothing:
+            return False
+        return type(state) is NodeState and type(operator) is bytes
+
+    def to_primitive(self) -> cbor2.CBORTag:
+        """Encode the fixed on-chain layout without walking the dataclass fields.
+
+        Produces the same primitives as the generic PlutusData encoding.
+        """
+        if not self._has_known_layout():
+            return PlutusData.to_primitive(self)
+        state = self.node_state
+        feed = state.ns_feed
+        if type(feed) is PriceFeed:
+            data_feed = feed.df
+            feed_fields = [data_feed.df_value, data_feed.df_last_update]
+            feed = _constr(
+                PriceFeed.CONSTR_ID,
+                IndefiniteList([_constr(DataFeed.CONSTR_ID, feed_fields)]),
+            )
+        else:
+            feed = _constr(Nothing.CONSTR_ID, [])
+        node_state = _constr(NodeState.CONSTR_ID, [state.ns_operator, feed])
+        return _constr(self.CONSTR_ID, IndefiniteList([node_state]))
+
+    def to_validated_primitive(self) -> cbor2.CBORTag:
+        """Skip the reflective validation when the layout is already checked."""
+        if self._has_known_layout():
+            return self.to_primitive()
+        return PlutusData.to_validated_primitive(self)
+
+
+def _constr(constr_id: int, fields: list) -> cbor2.CBORTag:
+    """Build a Plutus constructor with the given id and encoded fields."""
+    if fields:
+        fields = IndefiniteList(fields)
+    return cbor2.CBORTag(_CONSTR_TAG_BASE + constr_id, fields)
+
+
+def _constr_fields(value: cbor2.CBORTag, constr_id: int) -> list:
+    """Return the fields of a decoded Plutus constructor with the given id."""
+    if value.tag != _CONSTR_TAG_BASE + constr_id:
+        raise ValueError(f"Unexpected constructor tag {value.tag}")
+    return value.value
+
 
 @dataclass
 class OracleDatum(PlutusData):
@@ -141,6 +238,44 @@ class AggDatum(PlutusData):
     CONSTR_ID = 2
     aggstate: AggState
 
+    @classmethod
+    def fast_from_cbor(cls, raw: bytes) -> "AggDatum":
+        """Decode an AggDatum by unpacking its fixed on-chain layout directly.
+
+        Avoids the generic reflective PlutusData decoding, falling back to
+        from_cbor if the CBOR does not match the expected layout. Each call
+        builds new objects, so the result can be modified freely.
+        """
+        try:
+            (agg_state,) = _constr_fields(cbor2.loads(raw), cls.CONSTR_ID)
+            (settings,) = _constr_fields(agg_state, AggState.CONSTR_ID)
+            (node_list, *settings_ints, fee_price, iqr, divergence, platform) = (
+                _constr_fields(settings, OracleSettings.CONSTR_ID)
+            )
+            fees = _constr_fields(fee_price, PriceRewards.CONSTR_ID)
+            pkhs, threshold = _constr_fields(platform, OraclePlatform.CONSTR_ID)
+            ints = [*settings_ints, *fees, iqr, divergence, threshold]
+            if len(settings_ints) != 6 or len(fees) != 3:
+                raise ValueError("Unexpected AggDatum layout")
+            if not all(isinstance(i, int) for i in ints) or not all(
+                isinstance(pkh, bytes) for pkh in (*node_list, *pkhs)
+            ):
+                raise ValueError("Unexpected AggDatum field types")
+        except (ValueError, TypeError, AttributeError):
+            return cls.from_cbor(raw)
+        return cls(
+            AggState(
+                OracleSettings(
+                    IndefiniteList(list(node_list)),
+                    *settings_ints,
+                    PriceRewards(*fees),
+                    iqr,
+                    divergence,
+                    OraclePlatform(IndefiniteList(list(pkhs)), threshold),
+                )
+            )
+        )
+
 
 @dataclass
 class InitialOracleDatum(PlutusData):
@@ -1,7 +1,7 @@
 """Node contract transactions class"""
 
 # pylint: disable=unexpected-keyword-arg
-from copy import deepcopy
+import asyncio
 from typing import List, Optional, Tuple, Union
 
 from pycardano import (
@@ -10,6 +10,7 @@ from pycardano import (
     AssetName,
     BlockFrostChainContext,
     ExtendedSigningKey,
+    IndefiniteList,
     MultiAsset,
     Network,
     PaymentSigningKey,
@@ -31,18 +32,26 @@ from charli3_offchain_core.datums import (
     AggDatum,
     DataFeed,
     NodeDatum,
+    NodeState,
     OracleDatum,
+    OracleReward,
     PriceData,
     PriceFeed,
     PriceRewards,
     RewardDatum,
+    RewardInfo,
 )
 from charli3_offchain_core.oracle_checks import (
     c3_get_rate,
     check_utxo_asset_balance,
+    clone_output,
+    decode_node_datum,
+    filter_node_utxos_by_node_info,
+    filter_utxos_by_asset,
+    get_node_own_utxo,
     get_oracle_utxos_with_datums,
 )
-from charli3_offchain_core.redeemers import Aggregate, NodeCollect, NodeUpdate
+from charli3_offchain_core.redeemers import AGGREGATE, NODE_COLLECT, NODE_UPDATE
 from charli3_offchain_core.utils.logging_config import logging
 
 logger = logging.getLogger("Node")
@@ -51,6 +60,28 @@ logger = logging.getLogger("Node")
 COIN_PRECISION = 1000000
 
 
+def _decode_reward_datum(
+    datum: Union[RewardDatum, RawCBOR, None]
+) -> Optional[RewardDatum]:
+    """Decode a reward datum into a new object that callers may modify.
+
+    An already decoded datum may be shared with other UTxO lists, so it gets
+    a copy of its reward state, the only part callers update.
+    """
+    if isinstance(datum, RewardDatum):
+        state = datum.reward_state
+        rewards = [
+            RewardInfo(reward.reward_address, reward.reward_amount)
+            for reward in state.node_reward_list
+        ]
+        if isinstance(state.node_reward_list, IndefiniteList):
+            rewards = IndefiniteList(rewards)
+        return RewardDatum(OracleReward(rewards, state.platform_reward))
+    if isinstance(datum, RawCBOR):
+        return RewardDatum.from_cbor(datum.cbor)
+    return None
+
+
 class Node:
     """node transaction implementation"""
 
@@ -77,18 +108,23 @@ class Node:
         self.signing_key = signing_key
         self.verification_key = verification_key
         self.pub_key_hash = self.verification_key.hash()
+        self.pub_key_hash_bytes = bytes(self.pub_key_hash)
         self.address = Address(payment_part=self.pub_key_hash, network=self.network)
+        # Bech32 forms of the queried addresses, encoded once.
+        self.address_str = str(self.address)
         self.node_nft = node_nft
         self.aggstate_nft = aggstate_nft
         self.oracle_nft = oracle_nft
         self.reward_nft = reward_nft
-        self.node_operator = bytes.fromhex(str(self.pub_key_hash))
+        self.node_operator = self.pub_key_hash_bytes
         self.oracle_addr = oracle_addr
         self.c3_token_hash = c3_token_hash
         self.c3_token_name = c3_token_name
         self.reference_script_input = reference_script_input
         self.oracle_script_hash = self.oracle_addr.payment_part
         self.oracle_rate_addr = oracle_rate_addr
+        self.oracle_addr_str = str(oracle_addr)
+        self.oracle_rate_addr_str = str(oracle_rate_addr) if oracle_rate_addr else None
         self.rate_nft = oracle_rate_nft
         self.id = None
 
@@ -106,16 +142,24 @@ class Node:
                 None: if transaction is failed or dropped from the mempool.
         """
         logger.info("node update called: %d", rate)
-        oracle_utxos = await self.chain_query.get_utxos(self.oracle_addr)
-        node_own_utxo = self.get_node_own_utxo(oracle_utxos)
+        oracle_utxos = await self.chain_query.get_utxos(self.oracle_addr_str)
+        # Only the operators are peeked, the update writes a new datum anyway.
+        node_own_utxo = filter_node_utxos_by_node_info(
+            filter_utxos_by_asset(oracle_utxos, self.node_nft), self.node_operator
+        )
 
         if node_own_utxo is not None:
             time_ms = self.chain_query.get_current_posix_chain_time_ms()
             new_node_feed = PriceFeed(DataFeed(rate, time_ms))
 
-            node_own_utxo.output.datum.node_state.ns_feed = new_node_feed
+            # The UTxO may be shared by the chain query cache, so the new
+            # datum goes on a cloned output rather than the spent one.
+            node_output = clone_output(node_own_utxo.output)
+            node_output.datum = NodeDatum(
+                NodeState(ns_operator=self.node_operator, ns_feed=new_node_feed)
+            )
 
-            node_update_redeemer = Redeemer(NodeUpdate())
+            node_update_redeemer = Redeemer(NODE_UPDATE)
 
             builder = TransactionBuilder(self.context)
 
@@ -132,7 +176,7 @@ class Node:
 
             builder.add_script_input(
                 node_own_utxo, script=script_utxo, redeemer=node_update_redeemer
-            ).add_output(node_own_utxo.output)
+            ).add_output(node_output)
 
             return await self.chain_query.submit_tx_builder(
                 builder, self.signing_key, self.address
@@ -162,18 +206,18 @@ class Node:
         c3_oracle_rate_feed = None
         c3_oracle_rate_utxo = None
 
-        c3_oracle_rate_utxos = (
-            await self.chain_query.get_utxos(self.oracle_rate_addr)
-            if self.oracle_rate_addr
-            else None
-        )
+        # Fetch the oracle and rate UTxOs concurrently.
+        fetches = [self.chain_query.get_utxos(self.oracle_addr_str)]
+        if self.oracle_rate_addr:
+            fetches.append(self.chain_query.get_utxos(self.oracle_rate_addr_str))
+        oracle_utxos, *rate_utxos = await asyncio.gather(*fetches)
+        c3_oracle_rate_utxos = rate_utxos[0] if rate_utxos else None
 
         if c3_oracle_rate_utxos is not None:
             (c3_oracle_rate_feed, c3_oracle_rate_utxo) = c3_get_rate(
                 c3_oracle_rate_utxos, self.rate_nft
             )
 
-        oracle_utxos = await self.chain_query.get_utxos(self.oracle_addr)
         curr_time_ms = self.chain_query.get_current_posix_chain_time_ms()
         (
             oraclefeed_utxo,
@@ -189,9 +233,11 @@ class Node:
         )
         aggstate_datum: AggDatum = aggstate_utxo.output.datum
         oraclefeed_datum: OracleDatum = oraclefeed_utxo.output.datum
-        reward_datum: RewardDatum = reward_utxo.output.datum
-        total_nodes = len(aggstate_datum.aggstate.ag_settings.os_node_list)
-        fees = aggstate_datum.aggstate.ag_settings.os_node_fee_price
+        # The reward amounts are updated in place, so work on a fresh decode.
+        reward_datum = _decode_reward_datum(reward_utxo.output.datum)
+        settings = aggstate_datum.aggstate.ag_settings
+        total_nodes = len(settings.os_node_list)
+        fees = settings.os_node_fee_price
 
         min_c3_required = self.calculate_min_c3_required(
             fees, total_nodes, c3_oracle_rate_feed
@@ -202,34 +248,38 @@ class Node:
             aggstate_utxo, self.c3_token_hash, self.c3_token_name, min_c3_required
         ):
             valid_nodes, agg_value = aggregation_conditions(
-                aggstate_datum.aggstate.ag_settings,
+                settings,
                 oraclefeed_datum,
-                bytes(self.pub_key_hash),
+                self.pub_key_hash_bytes,
                 curr_time_ms,
                 nodes_utxos,
             )
-            if len(valid_nodes) > 0 and set(valid_nodes).issubset(set(nodes_utxos)):
+            # Compare by output reference, hashing a UTxO walks its whole output.
+            node_refs = {
+                (utxo.input.transaction_id, utxo.input.index) for utxo in nodes_utxos
+            }
+            if len(valid_nodes) > 0 and all(
+                (node.input.transaction_id, node.input.index) in node_refs
+                for node in valid_nodes
+            ):
+                # Fees paid in C3, scaled once by the exchange rate if present.
                 if not c3_oracle_rate_feed:
-                    c3_fees = (
-                        len(valid_nodes) * fees.node_fee
-                        + fees.aggregate_fee
-                        + fees.platform_fee
-                    )
+                    node_fee = fees.node_fee
+                    aggregate_fee = fees.aggregate_fee
+                    platform_fee = fees.platform_fee
                 else:
-                    c3_fees = (
-                        len(valid_nodes)
-                        * self.scale_reward(fees.node_fee, c3_oracle_rate_feed)
-                        + self.scale_reward(fees.aggregate_fee, c3_oracle_rate_feed)
-                        + self.scale_reward(fees.platform_fee, c3_oracle_rate_feed)
+                    node_fee = self.scale_reward(fees.node_fee, c3_oracle_rate_feed)
+                    aggregate_fee = self.scale_reward(
+                        fees.aggregate_fee, c3_oracle_rate_feed
+                    )
+                    platform_fee = self.scale_reward(
+                        fees.platform_fee, c3_oracle_rate_feed
                     )
+                c3_fees = len(valid_nodes) * node_fee + aggregate_fee + platform_fee
 
-                oracle_feed_expiry = (
-                    curr_time_ms + aggstate_datum.aggstate.ag_settings.os_aggregate_time
-                )
+                oracle_feed_expiry = curr_time_ms + settings.os_aggregate_time
 
                 logger.info("aggregate called with agg_value: %d", agg_value)
-                aggregate_redeemer = Redeemer(Aggregate())
-
                 script_utxo = (
                     await self.chain_query.get_reference_script_utxo(
                         self.oracle_addr,
@@ -243,26 +293,30 @@ class Node:
 
                 builder = TransactionBuilder(self.context)
 
-                aggstate_tx_output = deepcopy(aggstate_utxo.output)
-                aggstate_tx_output.amount.multi_asset[self.c3_token_hash][
-                    self.c3_token_name
-                ] -= c3_fees
+                aggstate_tx_output = clone_output(
+                    aggstate_utxo.output,
+                    self.c3_token_hash,
+                    self.c3_token_name,
+                    -c3_fees,
+                )
 
-                oraclefeed_tx_output = deepcopy(oraclefeed_utxo.output)
+                oraclefeed_tx_output = clone_output(oraclefeed_utxo.output)
                 oraclefeed_tx_output.datum = OracleDatum(
                     PriceData.set_price_map(agg_value, curr_time_ms, oracle_feed_expiry)
                 )
 
+                # The builder tags each Redeemer with its input index, so every
+                # script input gets its own wrapper around the shared data.
                 (
                     builder.add_script_input(
                         aggstate_utxo,
                         script=script_utxo,
-                        redeemer=deepcopy(aggregate_redeemer),
+                        redeemer=Redeemer(AGGREGATE),
                     )
                     .add_script_input(
                         oraclefeed_utxo,
                         script=script_utxo,
-                        redeemer=deepcopy(aggregate_redeemer),
+                        redeemer=Redeemer(AGGREGATE),
                     )
                     .add_output(aggstate_tx_output)
                     .add_output(oraclefeed_tx_output)
@@ -275,54 +329,24 @@ class Node:
                     node_operator = utxo.output.datum.node_state.ns_operator
                     for reward_info in reward_datum.reward_state.node_reward_list:
                         if reward_info.reward_address == node_operator:
-                            reward_info.reward_amount += (
-                                fees.node_fee
-                                if not c3_oracle_rate_feed
-                                else self.scale_reward(
-                                    fees.node_fee, c3_oracle_rate_feed
-                                )
-                            )
+                            reward_info.reward_amount += node_fee
                         if (
                             reward_info.reward_address == self.node_operator
                             and not aggregate_fee_added
                         ):
-                            reward_info.reward_amount += (
-                                fees.aggregate_fee
-                                if not c3_oracle_rate_feed
-                                else self.scale_reward(
-                                    fees.aggregate_fee, c3_oracle_rate_feed
-                                )
-                            )
+                            reward_info.reward_amount += aggregate_fee
                             aggregate_fee_added = True
 
                 # add platform fee to reward datum
-                reward_datum.reward_state.platform_reward += (
-                    fees.platform_fee
-                    if not c3_oracle_rate_feed
-                    else self.scale_reward(fees.platform_fee, c3_oracle_rate_feed)
+                reward_datum.reward_state.platform_reward += platform_fee
+                # The C3 entry is created if the reward UTxO does not hold any yet.
+                reward_tx_output = clone_output(
+                    reward_utxo.output, self.c3_token_hash, self.c3_token_name, c3_fees
                 )
-                reward_tx_output = deepcopy(reward_utxo.output)
-
-                if (
-                    self.c3_token_hash in reward_tx_output.amount.multi_asset
-                    and self.c3_token_name
-                    in reward_tx_output.amount.multi_asset[self.c3_token_hash]
-                ):
-                    reward_tx_output.amount.multi_asset[self.c3_token_hash][
-                        self.c3_token_name
-                    ] += c3_fees
-                else:
-                    # Handle the case where the key does not exist
-                    # For example, set the value to a default value
-                    c3_asset = MultiAsset(
-                        {self.c3_token_hash: Asset({self.c3_token_name: c3_fees})}
-                    )
-
-                    reward_tx_output.amount.multi_asset += c3_asset
                 reward_tx_output.datum = reward_datum
 
                 builder.add_script_input(
-                    reward_utxo, redeemer=deepcopy(aggregate_redeemer)
+                    reward_utxo, redeemer=Redeemer(AGGREGATE)
                 ).add_output(reward_tx_output)
 
                 # Adding reference oracle rate utxo
@@ -373,7 +397,7 @@ class Node:
                 Tuple[str, Transaction]: if transaction is successful and accepted by the network.
                 None: if transaction is failed or dropped from the mempool.
         """
-        oracle_utxos = await self.chain_query.get_utxos(self.oracle_addr)
+        oracle_utxos = await self.chain_query.get_utxos(self.oracle_addr_str)
         reward_utxo, reward_datum = self._get_reward_utxo_and_datum(oracle_utxos)
 
         c3_amount = 0
@@ -392,11 +416,12 @@ class Node:
             {self.c3_token_hash: Asset({self.c3_token_name: c3_amount})}
         )
 
-        tx_output = deepcopy(reward_utxo.output)
-        tx_output.amount.multi_asset -= c3_asset
+        tx_output = clone_output(
+            reward_utxo.output, self.c3_token_hash, self.c3_token_name, -c3_amount
+        )
         tx_output.datum = reward_datum
 
-        node_collect_redeemer = Redeemer(NodeCollect())
+        node_collect_redeemer = Redeemer(NODE_COLLECT)
 
         script_utxo = (
             await self.chain_query.get_reference_script_utxo(
@@ -433,8 +458,10 @@ class Node:
             UTxO: node's own UTxO
 
         """
-        nodes_utxos = self.filter_utxos_by_asset(oracle_utxos, self.node_nft)
-        return self.filter_node_utxos_by_node_operator(nodes_utxos)
+        utxo = get_node_own_utxo(oracle_utxos, self.node_nft, self.node_operator)
+        if utxo is not None and not isinstance(utxo.output.datum, NodeDatum):
+            utxo.output.datum = decode_node_datum(utxo.output.datum.cbor)
+        return utxo
 
     def filter_utxos_by_asset(self, utxos: List[UTxO], asset: MultiAsset) -> List[UTxO]:
         """
@@ -448,7 +475,7 @@ class Node:
             List[UTxO]: List of UTxOs filtered by given asset
 
         """
-        return list(filter(lambda x: x.output.amount.multi_asset >= asset, utxos))
+        return filter_utxos_by_asset(utxos, asset)
 
     def filter_node_utxos_by_node_operator(self, nodes_utxo: List[UTxO]) -> UTxO:
         """
@@ -461,24 +488,10 @@ class Node:
             UTxO: node's own UTxO filtered by given node_operator
 
         """
-        if len(nodes_utxo) > 0:
-            for utxo in nodes_utxo:
-                if utxo.output.datum:
-                    # Check if datum is not already a NodeDatum instance before
-                    # accessing cbor
-                    if (
-                        not isinstance(utxo.output.datum, NodeDatum)
-                        and utxo.output.datum.cbor
-                    ):
-                        utxo.output.datum = NodeDatum.from_cbor(utxo.output.datum.cbor)
-
-                    if (
-                        isinstance(utxo.output.datum, NodeDatum)
-                        and utxo.output.datum.node_state.ns_operator
-                        == self.node_operator
-                    ):
-                        return utxo
-        return None
+        utxo = filter_node_utxos_by_node_info(nodes_utxo, self.node_operator)
+        if utxo is not None and not isinstance(utxo.output.datum, NodeDatum):
+            utxo.output.datum = decode_node_datum(utxo.output.datum.cbor)
+        return utxo
 
     def update_own_node_utxo(
         self, nodes_utxo: List[UTxO], updated_node_feed: PriceFeed
@@ -497,7 +510,11 @@ class Node:
         if len(nodes_utxo) > 0:
             for utxo in nodes_utxo:
                 if utxo.output.datum.node_state.ns_operator == self.node_operator:
-                    utxo.output.datum.node_state.ns_feed = updated_node_feed
+                    utxo.output.datum = NodeDatum(
+                        NodeState(
+                            ns_operator=self.node_operator, ns_feed=updated_node_feed
+                        )
+                    )
 
         return nodes_utxo
 
@@ -508,15 +525,7 @@ class Node:
         rewardstate_utxo: UTxO = self.filter_utxos_by_asset(
             oracle_utxos, self.reward_nft
         )[0]
-        rewardstate_datum: RewardDatum = None
-
-        datum = rewardstate_utxo.output.datum
-
-        if isinstance(datum, RewardDatum):
-            rewardstate_datum = datum
-        elif isinstance(datum, RawCBOR):
-            rewardstate_datum = RewardDatum.from_cbor(datum.cbor)
-
+        rewardstate_datum = _decode_reward_datum(rewardstate_utxo.output.datum)
         return rewardstate_utxo, rewardstate_datum
 
     def scale_reward(self, val: int, c3_oracle_rate_feed: int) -> int:
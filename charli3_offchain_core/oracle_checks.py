@@ -1,15 +1,19 @@
 """Implementing Oracle checks and filters"""
 
-from typing import List, Tuple
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, List, Optional, Tuple
 
 from pycardano import (
     Address,
+    Asset,
     AssetName,
     DatumHash,
     IndefiniteList,
     MultiAsset,
     ScriptHash,
+    TransactionOutput,
     UTxO,
+    Value,
 )
 
 from charli3_offchain_core.datums import (
@@ -24,6 +28,113 @@ from charli3_offchain_core.utils.logging_config import logging
 logger = logging.getLogger("oracle-checks")
 
 
+def nft_key(nft: MultiAsset) -> Tuple[ScriptHash, AssetName]:
+    """Return the policy id and asset name of a single-token MultiAsset."""
+    policy_id, asset = next(iter(nft.items()))
+    return policy_id, next(iter(asset))
+
+
+def is_single_nft(asset: MultiAsset) -> bool:
+    """Check whether asset holds exactly one unit of a single token."""
+    if len(asset) != 1:
+        return False
+    token = next(iter(asset.values()))
+    return len(token) == 1 and next(iter(token.values())) == 1
+
+
+def has_nft(multi_asset: MultiAsset, policy_id: ScriptHash, name: AssetName) -> bool:
+    """Check whether multi_asset holds at least one unit of the given token.
+
+    Equivalent to ``multi_asset >= nft`` for a single NFT, but only looks up the
+    two keys instead of walking every policy and asset.
+    """
+    asset = multi_asset.get(policy_id)
+    return asset is not None and asset.get(name, 0) >= 1
+
+
+def clone_output(
+    output: TransactionOutput,
+    policy: Optional[ScriptHash] = None,
+    name: Optional[AssetName] = None,
+    delta: int = 0,
+) -> TransactionOutput:
+    """Clone a transaction output so its value can be modified independently.
+
+    The coin, multi-asset and asset containers are copied, while the address,
+    datum and script are shared with the original output; callers replace the
+    datum rather than mutating it.
+
+    Args:
+        output: The transaction output to clone.
+        policy: Policy id of a token whose quantity changes in the clone.
+        name: Asset name of that token.
+        delta: Quantity to add to the token, or subtract if negative. The
+            token entry is created or removed as needed.
+
+    Returns:
+        The cloned transaction output.
+    """
+    multi_asset = MultiAsset(
+        {
+            policy_id: Asset(asset)
+            for policy_id, asset in output.amount.multi_asset.items()
+        }
+    )
+    if delta:
+        asset = multi_asset.setdefault(policy, Asset())
+        quantity = asset.get(name, 0) + delta
+        if quantity:
+            asset[name] = quantity
+        else:
+            asset.pop(name, None)
+            if not asset:
+                del multi_asset[policy]
+    return TransactionOutput(
+        output.address,
+        Value(output.amount.coin, multi_asset),
+        datum_hash=output.datum_hash,
+        datum=output.datum,
+        script=output.script,
+        post_alonzo=output.post_alonzo,
+    )
+
+
+def decode_node_datum(cbor: bytes) -> NodeDatum:
+    """Decode a CBOR encoded NodeDatum.
+
+    Decoding goes through the layout-specific NodeDatum.fast_from_cbor, and
+    every call returns a new NodeDatum that the caller owns and may modify.
+    Callers that only need the operator should use NodeDatum.peek_operator.
+
+    Args:
+        cbor: The CBOR encoded NodeDatum.
+
+    Returns:
+        The decoded NodeDatum.
+    """
+    return NodeDatum.fast_from_cbor(cbor)
+
+
+def iter_utxos_by_asset(utxos: List[UTxO], asset: MultiAsset) -> Iterator[UTxO]:
+    """Lazily yield the UTxOs holding the given asset.
+
+    Args:
+        utxos: A list of UTxO objects to be filtered.
+        asset: The asset type to filter by.
+
+    Returns:
+        An iterator over the UTxO objects that match the specified asset type.
+    """
+    if is_single_nft(asset):
+        policy_id, name = nft_key(asset)
+        return (
+            utxo
+            for utxo in utxos
+            if has_nft(utxo.output.amount.multi_asset, policy_id, name)
+        )
+    return (utxo for utxo in utxos if utxo.output.amount.multi_asset >= asset)
+
+
 def filter_utxos_by_asset(utxos: List[UTxO], asset: MultiAsset) -> List[UTxO]:
     """Filter list of UTxOs by given asset type.
 
@@ -37,7 +148,33 @@ def filter_utxos_by_asset(utxos: List[UTxO], asset: MultiAsset) -> List[UTxO]:
     if utxos is None or not utxos:
         return []
 
-    return list(filter(lambda x: x.output.amount.multi_asset >= asset, utxos))
+    return list(iter_utxos_by_asset(utxos, asset))
+
+
+def partition_utxos_by_nft(
+    utxos: List[UTxO], nfts: Dict[str, MultiAsset]
+) -> Dict[str, List[UTxO]]:
+    """Group UTxOs by the NFT they hold in a single pass.
+
+    Each UTxO is placed under the first NFT it holds; UTxOs holding none of
+    the NFTs are dropped.
+
+    Args:
+        utxos: A list of UTxO objects to be grouped.
+        nfts: The single NFTs to group by, keyed by group name.
+
+    Returns:
+        The UTxOs holding each NFT, keyed by the same group names.
+    """
+    keys = [(name, *nft_key(nft)) for name, nft in nfts.items()]
+    groups: Dict[str, List[UTxO]] = {name: [] for name in nfts}
+    for utxo in utxos:
+        multi_asset = utxo.output.amount.multi_asset
+        for name, policy_id, asset_name in keys:
+            if has_nft(multi_asset, policy_id, asset_name):
+                groups[name].append(utxo)
+                break
+    return groups
 
 
 def filter_utxos_by_currency(utxos: List[UTxO], currency: ScriptHash) -> List[UTxO]:
@@ -53,9 +190,11 @@ def filter_utxos_by_currency(utxos: List[UTxO], currency: ScriptHash) -> List[UT
     if utxos is None or not utxos:
         return []
 
-    return list(
-        filter(lambda x: x.output.amount.multi_asset.get(currency) is not None, utxos)
-    )
+    return [
+        utxo
+        for utxo in utxos
+        if utxo.output.amount.multi_asset.get(currency) is not None
+    ]
 
 
 def filter_utxos_by_datum_hash(utxos: List[UTxO], datum_hash: DatumHash):
@@ -102,16 +241,10 @@ def filter_node_utxos_by_node_info(utxos: List[UTxO], node_info: bytes) -> UTxO:
     if utxos is None or not utxos:
         return None
 
-    return next(
-        (
-            utxo
-            for utxo in utxos
-            if utxo.output.datum
-            and NodeDatum.from_cbor(utxo.output.datum.cbor).node_state.ns_operator
-            == node_info
-        ),
-        None,
-    )
+    for utxo in utxos:
+        if _node_operator(utxo) == node_info:
+            return utxo
+    return None
 
 
 def check_node_exists(node_list: IndefiniteList, node: bytes) -> bool:
@@ -130,12 +263,48 @@ def check_node_exists(node_list: IndefiniteList, node: bytes) -> bool:
     return node in node_list
 
 
+def _node_operator(utxo: UTxO) -> Optional[bytes]:
+    """Return the operator of a node UTxO without decoding its whole datum."""
+    datum = utxo.output.datum
+    if not datum:
+        return None
+    if isinstance(datum, NodeDatum):
+        return datum.node_state.ns_operator
+    return NodeDatum.peek_operator(datum.cbor)
+
+
 def get_node_own_utxo(
     oracle_utxos: List[UTxO], node_nft: MultiAsset, node_info: bytes
 ) -> UTxO:
     """returns node's own utxo from list of oracle UTxOs"""
-    nodes_utxos = filter_utxos_by_asset(oracle_utxos, node_nft)
-    return filter_node_utxos_by_node_info(nodes_utxos, node_info)
+    policy_id, name = nft_key(node_nft)
+    for utxo in oracle_utxos:
+        if has_nft(utxo.output.amount.multi_asset, policy_id, name):
+            if _node_operator(utxo) == node_info:
+                return utxo
+    return None
+
+
+def index_node_utxos_by_operator(
+    oracle_utxos: List[UTxO], node_nft: MultiAsset
+) -> Dict[bytes, UTxO]:
+    """Map each node operator to its node UTxO in a single pass.
+
+    Args:
+        oracle_utxos: The list of oracle UTxOs.
+        node_nft: The node NFT.
+
+    Returns:
+        The node UTxOs keyed by node operator.
+    """
+    policy_id, name = nft_key(node_nft)
+    index: Dict[bytes, UTxO] = {}
+    for utxo in oracle_utxos:
+        if has_nft(utxo.output.amount.multi_asset, policy_id, name):
+            operator = _node_operator(utxo)
+            if operator is not None:
+                index[operator] = utxo
+    return index
 
 
 def check_utxo_asset_balance(
@@ -155,19 +324,17 @@ def check_utxo_asset_balance(
     Returns:
         True if the input UTxO has at least the minimum required balance, False otherwise.
     """
-    if input_utxo.output.amount.multi_asset is None:
-        return False
-
-    if input_utxo.output.amount.multi_asset.get(asset_policy_id) is None:
+    multi_asset = input_utxo.output.amount.multi_asset
+    if multi_asset is None:
         return False
 
-    if input_utxo.output.amount.multi_asset[asset_policy_id].get(token_name) is None:
+    asset = multi_asset.get(asset_policy_id)
+    if asset is None:
         return False
 
+    amount = asset.get(token_name)
     # Check if input UTxO has at least the minimum required balance
-    return (
-        input_utxo.output.amount.multi_asset[asset_policy_id][token_name] >= min_amount
-    )
+    return amount is not None and amount >= min_amount
 
 
 def filter_valid_node_utxos(
@@ -188,26 +355,28 @@ def filter_valid_node_utxos(
         A list of UTxO objects that are valid according to the specified criteria.
     """
     result: List[UTxO] = []
-    node_expiry = aggstate_datum.aggstate.agSettings.os_updated_node_time
-
-    if len(node_utxos) > 0:
-        for utxo in node_utxos:
-            if utxo.output.datum:
-                node_datum: NodeDatum = NodeDatum.from_cbor(utxo.output.datum.cbor)
-
-                if not isinstance(node_datum.node_state.nodeFeed, Nothing):
-                    # nodes are initialized
-                    if (
-                        node_datum.node_state.nodeFeed.df.dfLastUpdate + node_expiry
-                        > current_timestamp
-                    ):
-                        # nodes are not expired
-                        if oracle_feed_datum.price_data is not None:
-                            # To DO: check if nodes are included in last aggregation
-                            pass
-                        else:
-                            # print(node_datum.node_state.nodeFeed.df.dfLastUpdate)
-                            result.append(utxo)
+    if not node_utxos or oracle_feed_datum.price_data is not None:
+        # To DO: check if nodes are included in last aggregation
+        return result
+
+    # Nodes updated at or before this time are expired.
+    expired_before = (
+        current_timestamp - aggstate_datum.aggstate.ag_settings.os_updated_node_time
+    )
+    for utxo in node_utxos:
+        datum = utxo.output.datum
+        if not datum:
+            continue
+        node_datum: NodeDatum = (
+            datum if isinstance(datum, NodeDatum) else decode_node_datum(datum.cbor)
+        )
+        node_feed = node_datum.node_state.ns_feed
+        # nodes are initialized and not expired
+        if (
+            not isinstance(node_feed, Nothing)
+            and node_feed.df.df_last_update > expired_before
+        ):
+            result.append(utxo)
     return result
 
 
@@ -215,22 +384,22 @@ def convert_cbor_to_node_datums(node_utxos: List[UTxO]) -> List[UTxO]:
     """
     Convert CBOR encoded NodeDatum objects to their corresponding Python objects.
 
+    The datums are decoded in place; UTxOs without a datum are left untouched.
+
     Parameters:
     - node_utxos (List[UTxO]): A list of UTxO objects that contain NodeDatum objects in CBOR
       encoding.
 
     Returns:
-    - A list of UTxO objects that contain NodeDatum objects in their original Python format.
+    - The same list, with NodeDatum objects in their original Python format.
     """
-    result: List[UTxO] = []
+    if not node_utxos:
+        return node_utxos
     for utxo in node_utxos:
-        if utxo.output.datum and not isinstance(utxo.output.datum, NodeDatum):
-            if utxo.output.datum.cbor:
-                utxo.output.datum = NodeDatum.from_cbor(utxo.output.datum.cbor)
-                result.append(utxo)
-        elif utxo.output.datum and isinstance(utxo.output.datum, NodeDatum):
-            result.append(utxo)
-    return result
+        datum = utxo.output.datum
+        if datum is not None and not isinstance(datum, NodeDatum) and datum.cbor:
+            utxo.output.datum = decode_node_datum(datum.cbor)
+    return node_utxos
 
 
 def c3_get_oracle_rate_utxo_with_datum(
@@ -244,10 +413,7 @@ def c3_get_oracle_rate_utxo_with_datum(
 
     Returns:
         A UTxO object that is valid according to the specified criteria."""
-    rate_utxo = next(
-        (utxo for utxo in oracle_utxos if utxo.output.amount.multi_asset >= rate_nft),
-        None,
-    )
+    rate_utxo = next(iter_utxos_by_asset(oracle_utxos, rate_nft), None)
 
     try:
         if rate_utxo.output.datum:
@@ -280,6 +446,64 @@ def c3_get_rate(
         return (None, None)
 
 
+@dataclass
+class OracleUtxoIndex:
+    """Oracle UTxOs bucketed by the NFT they hold, built in a single pass."""
+
+    aggstate_utxo: Optional[UTxO] = None
+    oraclefeed_utxo: Optional[UTxO] = None
+    reward_utxo: Optional[UTxO] = None
+    nodes_utxos: List[UTxO] = field(default_factory=list)
+    """ node UTxOs with their datum decoded to NodeDatum """
+    nodes_by_operator: Dict[bytes, UTxO] = field(default_factory=dict)
+
+    @classmethod
+    def from_utxos(
+        cls,
+        oracle_utxos: List[UTxO],
+        aggstate_nft: MultiAsset,
+        oracle_nft: MultiAsset,
+        reward_nft: MultiAsset,
+        node_nft: MultiAsset,
+    ) -> "OracleUtxoIndex":
+        """
+        Classify the oracle UTxOs by NFT and decode the node datums.
+
+        Parameters:
+            - oracle_utxos (List[UTxO]): The list of UTxOs to index.
+            - aggstate_nft (MultiAsset): The aggstate NFT.
+            - oracle_nft (MultiAsset): The oracle feed NFT.
+            - reward_nft (MultiAsset): The reward NFT.
+            - node_nft (MultiAsset): The node NFT.
+
+        Returns:
+            OracleUtxoIndex: The indexed UTxOs.
+        """
+        aggstate_key = nft_key(aggstate_nft)
+        oracle_key = nft_key(oracle_nft)
+        reward_key = nft_key(reward_nft)
+        node_key = nft_key(node_nft)
+
+        index = cls()
+        # Each UTxO holds at most one oracle NFT.
+        for utxo in oracle_utxos:
+            multi_asset = utxo.output.amount.multi_asset
+            if index.aggstate_utxo is None and has_nft(multi_asset, *aggstate_key):
+                index.aggstate_utxo = utxo
+            elif index.oraclefeed_utxo is None and has_nft(multi_asset, *oracle_key):
+                index.oraclefeed_utxo = utxo
+            elif index.reward_utxo is None and has_nft(multi_asset, *reward_key):
+                index.reward_utxo = utxo
+            elif has_nft(multi_asset, *node_key):
+                datum = utxo.output.datum
+                if datum and not isinstance(datum, NodeDatum) and datum.cbor:
+                    datum = utxo.output.datum = decode_node_datum(datum.cbor)
+                if isinstance(datum, NodeDatum):
+                    index.nodes_utxos.append(utxo)
+                    index.nodes_by_operator[datum.node_state.ns_operator] = utxo
+        return index
+
+
 def get_oracle_utxos_with_datums(
     oracle_utxos: List[UTxO],
     aggstate_nft: MultiAsset,
@@ -303,33 +527,20 @@ def get_oracle_utxos_with_datums(
         converted UTxOs for the AggDatum, OracleDatum, RewardDatum, and
         NodeDatum  objects.
     """
-    aggstate_utxo = next(
-        (
-            utxo
-            for utxo in oracle_utxos
-            if utxo.output.amount.multi_asset >= aggstate_nft
-        ),
-        None,
-    )
-    oraclefeed_utxo = next(
-        (utxo for utxo in oracle_utxos if utxo.output.amount.multi_asset >= oracle_nft),
-        None,
-    )
-    reward_utxo = next(
-        (utxo for utxo in oracle_utxos if utxo.output.amount.multi_asset >= reward_nft),
-        None,
+    index = OracleUtxoIndex.from_utxos(
+        oracle_utxos, aggstate_nft, oracle_nft, reward_nft, node_nft
     )
-    nodes_utxos = [
-        utxo for utxo in oracle_utxos if utxo.output.amount.multi_asset >= node_nft
-    ]
-    node_utxos_with_datum = convert_cbor_to_node_datums(nodes_utxos)
+    aggstate_utxo = index.aggstate_utxo
+    oraclefeed_utxo = index.oraclefeed_utxo
+    reward_utxo = index.reward_utxo
+    node_utxos_with_datum = index.nodes_utxos
 
     try:
         if (
             not isinstance(aggstate_utxo.output.datum, AggDatum)
             and aggstate_utxo.output.datum.cbor
         ):
-            aggstate_utxo.output.datum = AggDatum.from_cbor(
+            aggstate_utxo.output.datum = AggDatum.fast_from_cbor(
                 aggstate_utxo.output.datum.cbor
             )
     except Exception:
@@ -1,14 +1,16 @@
 """Oracle Owner contract transactions class"""
 
 # pylint: disable=unexpected-keyword-arg
-from copy import deepcopy
+import asyncio
 from typing import List, Literal, Optional, Tuple, Union
 
 from pycardano import (
+    VERIFICATION_KEY_HASH_SIZE,
     Address,
     Asset,
     AssetName,
     ExtendedSigningKey,
+    IndefiniteList,
     MultiAsset,
     NativeScript,
     Network,
@@ -28,7 +30,7 @@ from pycardano import (
     plutus_script_hash,
 )
 
-from charli3_offchain_core.chain_query import ChainQuery, StagedTxSubmitter
+from charli3_offchain_core.chain_query import ChainQuery
 from charli3_offchain_core.datums import (
     AggDatum,
     NodeDatum,
@@ -41,25 +43,43 @@ from charli3_offchain_core.datums import (
     RewardInfo,
 )
 from charli3_offchain_core.oracle_checks import (
-    check_node_exists,
     check_type,
-    filter_utxos_by_asset,
-    get_node_own_utxo,
+    clone_output,
+    has_nft,
+    index_node_utxos_by_operator,
+    nft_key,
+    partition_utxos_by_nft,
 )
 from charli3_offchain_core.redeemers import (
-    AddFunds,
-    AddNodes,
-    MintToken,
-    OracleClose,
-    PlatformCollect,
-    RemoveNodes,
-    UpdateSettings,
+    ADD_FUNDS,
+    ADD_NODES,
+    MINT_TOKEN,
+    ORACLE_CLOSE,
+    PLATFORM_COLLECT,
+    REMOVE_NODES,
+    UPDATE_SETTINGS,
 )
 from charli3_offchain_core.utils.logging_config import logging
 
 logger = logging.getLogger("Oracle-Owner")
 
 
+def _pkhs_to_bytes(pkhs: List[Union[str, bytes]]) -> List[bytes]:
+    """Convert hex (or raw) verification key hashes to bytes."""
+    result = [
+        bytes.fromhex(pkh) if isinstance(pkh, str) else bytes(pkh) for pkh in pkhs
+    ]
+    for pkh in result:
+        if len(pkh) != VERIFICATION_KEY_HASH_SIZE:
+            raise ValueError(f"Invalid verification key hash: {pkh.hex()}")
+    return result
+
+
+def _pkhs_to_vkhs(pkhs: List[str]) -> List[VerificationKeyHash]:
+    """Convert the platform multisig key hashes to required signers."""
+    return [VerificationKeyHash.from_primitive(pkh) for pkh in pkhs]
+
+
 class OracleOwner:
     """oracle owner transaction implementation"""
 
@@ -112,11 +132,7 @@ class OracleOwner:
             check_type(validity_start, int, "validity_start")
         self.network = network
         self.chainquery = chainquery
-        self.staged_query = StagedTxSubmitter(
-            chainquery.blockfrost_context,
-            chainquery.ogmios_context,
-            oracle_addr,
-        )
+        self.staged_query = chainquery.staged_submitter(oracle_addr)
         self.signing_key = signing_key
         self.verification_key = verification_key
         self.pub_key_hash = self.verification_key.hash()
@@ -130,26 +146,31 @@ class OracleOwner:
             staking_part=self.stake_key_hash,
             network=self.network,
         )
+        self.address_str = str(self.address)
         self.node_nft = node_nft
         self.aggstate_nft = aggstate_nft
         self.oracle_nft = oracle_nft
         self.reward_nft = reward_nft
+        # (policy id, asset name) of each NFT, for direct lookups in UTxO values
+        self.aggstate_nft_key = nft_key(aggstate_nft)
+        self.oracle_nft_key = nft_key(oracle_nft)
+        self.reward_nft_key = nft_key(reward_nft)
         self.oracle_addr = Address.from_primitive(oracle_addr)
+        # Bech32 form of the oracle address used for queries, encoded once.
+        self.oracle_addr_str = str(self.oracle_addr)
         self.oracle_script_hash = self.oracle_addr.payment_part
         self.nft_hash = minting_nft_hash
         self.c3_token_hash = c3_token_hash
         self.c3_token_name = c3_token_name
-        self.single_node_nft = MultiAsset.from_primitive(
-            {self.nft_hash.payload: {b"NodeFeed": 1}}
+        self.node_nft_name = AssetName(b"NodeFeed")
+        self.single_node_nft = MultiAsset(
+            {self.nft_hash: Asset({self.node_nft_name: 1})}
         )
         self.reference_script_input = reference_script_input
-        self.script_utxo = (
-            self.chainquery.get_reference_script_utxo(
-                self.oracle_addr, self.reference_script_input, self.oracle_script_hash
-            )
-            if self.reference_script_input
-            else None
-        )
+        # Resolved on first use by load_script_utxo.
+        self._script_utxo: Optional[UTxO] = None
+        # Resolved on first use by _load_nft_minting_script.
+        self._nft_minting_script: Optional[PlutusV2Script] = None
         if minting_script:
             self.minting_script = minting_script
             self.validity_start = validity_start
@@ -157,19 +178,79 @@ class OracleOwner:
             self.minting_script = None
             self.validity_start = None
 
+    @property
+    def script_utxo(self) -> Optional[UTxO]:
+        """Reference script UTxO of the oracle.
+
+        It is looked up when the first transaction is built, so it reads None
+        until then unless load_script_utxo() is awaited first. Assigning a UTxO
+        skips the lookup.
+        """
+        return self._script_utxo
+
+    @script_utxo.setter
+    def script_utxo(self, utxo: Optional[UTxO]) -> None:
+        self._script_utxo = utxo
+
+    async def load_script_utxo(self) -> Optional[UTxO]:
+        """Return the reference script UTxO, looking it up on the first call."""
+        if self._script_utxo is None and self.reference_script_input:
+            self._script_utxo = await self.chainquery.get_reference_script_utxo(
+                self.oracle_addr, self.reference_script_input, self.oracle_script_hash
+            )
+        return self._script_utxo
+
+    async def _load_nft_minting_script(self) -> None:
+        """Fetch the Plutus NFT minting script, only on the first call."""
+        if self.minting_script is None and self._nft_minting_script is None:
+            self._nft_minting_script = await self.chainquery.get_plutus_script(
+                self.nft_hash
+            )
+
+    async def _fetch_oracle_utxos(self, minting: bool = False) -> List[UTxO]:
+        """Query the oracle UTxOs and load what the tx build needs alongside.
+
+        The NFT minting script is loaded at the same time for transactions
+        that mint or burn.
+        """
+        pending = [self.chainquery.get_utxos(self.oracle_addr_str)]
+        if minting:
+            pending.append(self._load_nft_minting_script())
+        oracle_utxos, *_ = await asyncio.gather(*pending)
+        # With the UTxO cache on, this reuses the oracle UTxOs just queried.
+        await self.load_script_utxo()
+        return oracle_utxos
+
+    async def prefetch_utxos(self) -> List[UTxO]:
+        """Query the oracle UTxOs so the next owner operations reuse them.
+
+        The result stays cached by the chain query for its utxo TTL, or until
+        a transaction is submitted.
+        """
+        return await self.chainquery.get_utxos(self.oracle_addr_str)
+
+    def refresh_reference_script(self) -> None:
+        """Forget the loaded reference script UTxO so the next tx looks it up."""
+        self._script_utxo = None
+
     async def mk_add_nodes_tx(
         self, platform_multisig_pkhs: List[str], pkhs: List[str]
     ) -> Transaction:
         """Add nodes to oracle script."""
-        pkhs = list(map(lambda x: bytes(VerificationKeyHash.from_primitive(x)), pkhs))
-        eligible_nodes = await self._get_eligible_nodes(pkhs, operation="add")
+        pkhs = _pkhs_to_bytes(pkhs)
+        oracle_utxos = await self._fetch_oracle_utxos(minting=True)
+        aggstate_utxo, aggstate_datum = await self._get_aggstate_utxo_and_datum(
+            oracle_utxos
+        )
+        eligible_nodes = await self._get_eligible_nodes(
+            pkhs, operation="add", aggstate_datum=aggstate_datum
+        )
 
         if not eligible_nodes:
             logger.error("No eligible nodes to add.")
             return
 
-        aggstate_utxo, aggstate_datum = await self._get_aggstate_utxo_and_datum()
-        reward_utxo, reward_datum = await self._get_reward_utxo_and_datum()
+        reward_utxo, reward_datum = await self._get_reward_utxo_and_datum(oracle_utxos)
 
         if len(eligible_nodes) > 0:
             updated_aggstate_datum = self._add_nodes_to_aggstate(
@@ -178,10 +259,10 @@ class OracleOwner:
             updated_reward_datum = self._add_nodes_to_rewardstate(
                 reward_datum, eligible_nodes
             )
-            updated_reward_utxo_output = deepcopy(reward_utxo.output)
+            updated_reward_utxo_output = clone_output(reward_utxo.output)
             updated_reward_utxo_output.datum = updated_reward_datum
             node_nfts = self._get_node_nfts("add", len(eligible_nodes))
-            add_redeemer = Redeemer(AddNodes())
+            add_redeemer = Redeemer(ADD_NODES)
 
             builder = self._prepare_builder(
                 aggstate_utxo,
@@ -191,14 +272,12 @@ class OracleOwner:
                 updated_reward_utxo_output=updated_reward_utxo_output,
                 redeemer=add_redeemer,
             )
-            node_outputs = self._create_node_outputs(eligible_nodes)
-            for node_output in node_outputs:
+            # Node outputs carry inline datums, so they can be appended as a
+            # batch without going through add_output one by one.
+            for node_output in self._create_node_outputs(eligible_nodes):
                 builder.add_output(node_output)
 
-            platform_multisig_vkhs = list(
-                map(VerificationKeyHash.from_primitive, platform_multisig_pkhs)
-            )
-            builder.required_signers = platform_multisig_vkhs
+            builder.required_signers = _pkhs_to_vkhs(platform_multisig_pkhs)
 
             tx = await self.staged_query.build_tx(
                 builder, self.signing_key, self.address
@@ -210,15 +289,20 @@ class OracleOwner:
         self, platform_multisig_pkhs: List[str], pkhs: List[str]
     ) -> Transaction:
         """Remove nodes from the oracle script."""
-        pkhs = [bytes.fromhex(pkh) for pkh in pkhs]
-        eligible_nodes = await self._get_eligible_nodes(pkhs, operation="remove")
+        pkhs = _pkhs_to_bytes(pkhs)
+        oracle_utxos = await self._fetch_oracle_utxos(minting=True)
+        aggstate_utxo, aggstate_datum = await self._get_aggstate_utxo_and_datum(
+            oracle_utxos
+        )
+        eligible_nodes = await self._get_eligible_nodes(
+            pkhs, operation="remove", aggstate_datum=aggstate_datum
+        )
 
         if not eligible_nodes:
             logger.error("No eligible nodes to remove.")
             return
 
-        aggstate_utxo, aggstate_datum = await self._get_aggstate_utxo_and_datum()
-        reward_utxo, reward_datum = await self._get_reward_utxo_and_datum()
+        reward_utxo, reward_datum = await self._get_reward_utxo_and_datum(oracle_utxos)
 
         if len(eligible_nodes) > 0:
             updated_aggstate_datum = self._remove_nodes_from_aggstate(
@@ -230,7 +314,7 @@ class OracleOwner:
                 reward_amount_to_distribute,
             ) = self._remove_nodes_from_rewardstate(reward_datum, eligible_nodes)
             if reward_amount_to_distribute >= 0:
-                updated_reward_utxo_output = deepcopy(reward_utxo.output)
+                updated_reward_utxo_output = clone_output(reward_utxo.output)
 
                 if reward_amount_to_distribute > 0:
                     c3_asset_to_distribute = MultiAsset(
@@ -245,10 +329,10 @@ class OracleOwner:
                     )
                 updated_reward_utxo_output.datum = updated_reward_datum
             else:
-                updated_reward_utxo_output = deepcopy(reward_utxo.output)
+                updated_reward_utxo_output = clone_output(reward_utxo.output)
 
             node_nfts = self._get_node_nfts("remove", len(eligible_nodes))
-            remove_redeemer = Redeemer(RemoveNodes())
+            remove_redeemer = Redeemer(REMOVE_NODES)
             builder = self._prepare_builder(
                 aggstate_utxo=aggstate_utxo,
                 updated_aggstate_datum=updated_aggstate_datum,
@@ -275,12 +359,9 @@ class OracleOwner:
                             amount=Value(2000000, c3_asset),
                         )
                     )
-            self._burn_node_nfts(eligible_nodes, builder, remove_redeemer)
+            self._burn_node_nfts(eligible_nodes, builder, remove_redeemer, oracle_utxos)
 
-            platform_multisig_vkhs = list(
-                map(VerificationKeyHash.from_primitive, platform_multisig_pkhs)
-            )
-            builder.required_signers = platform_multisig_vkhs
+            builder.required_signers = _pkhs_to_vkhs(platform_multisig_pkhs)
 
             tx = await self.staged_query.build_tx(
                 builder, self.signing_key, self.address
@@ -292,12 +373,15 @@ class OracleOwner:
         self, platform_multisig_pkhs: List[str], settings: OracleSettings
     ) -> Transaction:
         """edit settings of oracle script."""
-        aggstate_utxo, aggstate_datum = await self._get_aggstate_utxo_and_datum()
+        oracle_utxos = await self._fetch_oracle_utxos()
+        aggstate_utxo, aggstate_datum = await self._get_aggstate_utxo_and_datum(
+            oracle_utxos
+        )
+        current_settings = aggstate_datum.aggstate.ag_settings
 
         if (
-            settings != aggstate_datum.aggstate.ag_settings
-            and settings.os_node_list
-            == aggstate_datum.aggstate.ag_settings.os_node_list
+            settings != current_settings
+            and settings.os_node_list == current_settings.os_node_list
         ):
             # prepare datums
             updated_aggstate_datum = self._update_aggstate(aggstate_datum, settings)
@@ -308,10 +392,7 @@ class OracleOwner:
                 updated_aggstate_datum=updated_aggstate_datum,
             )
 
-            platform_multisig_vkhs = list(
-                map(VerificationKeyHash.from_primitive, platform_multisig_pkhs)
-            )
-            builder.required_signers = platform_multisig_vkhs
+            builder.required_signers = _pkhs_to_vkhs(platform_multisig_pkhs)
 
             tx = await self.staged_query.build_tx(
                 builder, self.signing_key, self.address
@@ -328,21 +409,21 @@ class OracleOwner:
 
     async def add_funds(self, funds: int):
         """add funds (payment token) to aggstate UTxO of oracle script."""
-
-        aggstate_utxo, _ = await self._get_aggstate_utxo_and_datum()
+        oracle_utxos = await self._fetch_oracle_utxos()
+        aggstate_utxo, _ = await self._get_aggstate_utxo_and_datum(oracle_utxos)
 
         if funds > 0:
             # prepare datums, redeemers and new node utxos for eligible nodes
-            add_funds_redeemer = Redeemer(AddFunds())
+            add_funds_redeemer = Redeemer(ADD_FUNDS)
 
             builder = TransactionBuilder(self.chainquery.context)
             builder.add_script_input(
                 aggstate_utxo,
                 script=self.script_utxo,
-                redeemer=deepcopy(add_funds_redeemer),
+                redeemer=add_funds_redeemer,
             )
 
-            aggstate_tx_output = deepcopy(aggstate_utxo.output)
+            aggstate_tx_output = clone_output(aggstate_utxo.output)
 
             # check if c3 token already exist in aggstate utxo
             if (
@@ -370,9 +451,9 @@ class OracleOwner:
         self, platform_multisig_pkhs: List[str], withdrawal_addr: Address
     ) -> Transaction:
         """Collect oracle admin c3 rewards from oracle script."""
-
-        reward_utxo, reward_datum = await self._get_reward_utxo_and_datum()
-        aggstate_utxo, _ = await self._get_aggstate_utxo_and_datum()
+        oracle_utxos = await self._fetch_oracle_utxos()
+        reward_utxo, reward_datum = await self._get_reward_utxo_and_datum(oracle_utxos)
+        aggstate_utxo, _ = await self._get_aggstate_utxo_and_datum(oracle_utxos)
 
         # check if platform reward is available
         if reward_datum.reward_state.platform_reward > 0:
@@ -383,18 +464,18 @@ class OracleOwner:
             c3_asset = MultiAsset(
                 {self.c3_token_hash: Asset({self.c3_token_name: platform_reward})}
             )
-            tx_output = deepcopy(reward_utxo.output)
+            tx_output = clone_output(reward_utxo.output)
             tx_output.amount.multi_asset -= c3_asset
             tx_output.datum = reward_datum
 
             # prepare builder
-            platform_collect_redeemer = Redeemer(PlatformCollect())
+            platform_collect_redeemer = Redeemer(PLATFORM_COLLECT)
 
             builder = TransactionBuilder(self.chainquery.context)
             builder.add_script_input(
                 reward_utxo,
                 script=self.script_utxo,
-                redeemer=deepcopy(platform_collect_redeemer),
+                redeemer=platform_collect_redeemer,
             ).add_output(tx_output).add_output(
                 TransactionOutput(
                     address=withdrawal_addr,
@@ -405,10 +486,7 @@ class OracleOwner:
             # Reference AggState
             builder.reference_inputs.add(aggstate_utxo)
 
-            platform_multisig_vkhs = list(
-                map(VerificationKeyHash.from_primitive, platform_multisig_pkhs)
-            )
-            builder.required_signers = platform_multisig_vkhs
+            builder.required_signers = _pkhs_to_vkhs(platform_multisig_pkhs)
 
             tx = await self.staged_query.build_tx(
                 builder, self.signing_key, self.address
@@ -425,46 +503,55 @@ class OracleOwner:
         disbursementChoice: Literal["TO_NODES", "TO_ONE_ADDRESS"],
     ) -> Transaction:
         """remove all oralce utxos from oracle script."""
+        oracle_utxos = await self._fetch_oracle_utxos(minting=True)
+        groups = partition_utxos_by_nft(
+            oracle_utxos,
+            {
+                "aggstate": self.aggstate_nft,
+                "oraclefeed": self.oracle_nft,
+                "reward": self.reward_nft,
+                "nodes": self.node_nft,
+            },
+        )
+        node_utxos: List[UTxO] = groups["nodes"]
 
-        oracle_utxos = self.chainquery.context.utxos(self.oracle_addr)
-        node_utxos: List[UTxO] = filter_utxos_by_asset(oracle_utxos, self.node_nft)
-
-        oraclefeed_utxo: UTxO = filter_utxos_by_asset(oracle_utxos, self.oracle_nft)[0]
-        aggstate_utxo: UTxO = filter_utxos_by_asset(oracle_utxos, self.aggstate_nft)[0]
+        oraclefeed_utxo: UTxO = groups["oraclefeed"][0]
+        aggstate_utxo: UTxO = groups["aggstate"][0]
 
-        reward_utxo, reward_datum = await self._get_reward_utxo_and_datum()
+        reward_utxo, reward_datum = await self._get_reward_utxo_and_datum(
+            groups["reward"]
+        )
 
         if oraclefeed_utxo and aggstate_utxo and reward_utxo:
             # prepare datums, redeemers and new node utxos for eligible nodes
-            oracle_close_redeemer = Redeemer(OracleClose())
-
             builder = TransactionBuilder(self.chainquery.context)
             builder.add_script_input(
                 aggstate_utxo,
                 script=self.script_utxo,
-                redeemer=deepcopy(oracle_close_redeemer),
+                redeemer=Redeemer(ORACLE_CLOSE),
             )
             builder.add_script_input(
                 oraclefeed_utxo,
                 script=self.script_utxo,
-                redeemer=deepcopy(oracle_close_redeemer),
+                redeemer=Redeemer(ORACLE_CLOSE),
             )
             builder.add_script_input(
                 reward_utxo,
                 script=self.script_utxo,
-                redeemer=deepcopy(oracle_close_redeemer),
+                redeemer=Redeemer(ORACLE_CLOSE),
             )
 
-            oracle_nfts = MultiAsset.from_primitive(
+            # Negative quantities indicate burning
+            oracle_nfts = MultiAsset(
                 {
-                    self.nft_hash.payload: {
-                        b"NodeFeed": -len(
-                            node_utxos
-                        ),  # Negative sign indicates burning
-                        b"AggState": -1,
-                        b"OracleFeed": -1,
-                        b"Reward": -1,
-                    }
+                    self.nft_hash: Asset(
+                        {
+                            self.node_nft_name: -len(node_utxos),
+                            AssetName(b"AggState"): -1,
+                            AssetName(b"OracleFeed"): -1,
+                            AssetName(b"Reward"): -1,
+                        }
+                    )
                 }
             )
 
@@ -472,9 +559,8 @@ class OracleOwner:
                 builder.native_scripts = [self.minting_script]
                 builder.validity_start = self.validity_start
             else:
-                nft_minting_script = self.chainquery.get_plutus_script(self.nft_hash)
                 builder.add_minting_script(
-                    nft_minting_script, redeemer=Redeemer(MintToken())
+                    self._nft_minting_script, redeemer=Redeemer(MINT_TOKEN)
                 )
 
             builder.mint = oracle_nfts
@@ -484,7 +570,7 @@ class OracleOwner:
                 builder.add_script_input(
                     node,
                     script=self.script_utxo,
-                    redeemer=deepcopy(oracle_close_redeemer),
+                    redeemer=Redeemer(ORACLE_CLOSE),
                 )
 
             def get_c3_amount(utxo):
@@ -549,10 +635,7 @@ class OracleOwner:
             # Add the output to the transaction builder
             builder.add_output(output)
 
-            platform_multisig_vkhs = list(
-                map(VerificationKeyHash.from_primitive, platform_multisig_pkhs)
-            )
-            builder.required_signers = platform_multisig_vkhs
+            builder.required_signers = _pkhs_to_vkhs(platform_multisig_pkhs)
 
             tx = await self.staged_query.build_tx(
                 builder, self.signing_key, self.address
@@ -569,7 +652,9 @@ class OracleOwner:
         script_transaction_fee_amount = 66000000
 
         if not oracle_script:
-            oracle_script = self.chainquery.get_plutus_script(self.oracle_script_hash)
+            oracle_script = await self.chainquery.get_plutus_script(
+                self.oracle_script_hash
+            )
 
         if plutus_script_hash(oracle_script) == self.oracle_script_hash:
             # Reference script output
@@ -592,14 +677,14 @@ class OracleOwner:
 
     async def initialize_oracle_datum(self):
         """initialise oracle datum"""
-        oracle_utxos = self.chainquery.context.utxos(self.oracle_addr)
-        oraclefeed_utxo: UTxO = filter_utxos_by_asset(oracle_utxos, self.oracle_nft)[0]
+        oracle_utxos = await self._fetch_oracle_utxos()
+        oraclefeed_utxo: UTxO = self._find_nft_utxo(oracle_utxos, self.oracle_nft_key)
         oraclefeed_datum: OracleDatum = OracleDatum.from_cbor(
             oraclefeed_utxo.output.datum.cbor
         )
 
         if oraclefeed_datum.price_data is None:
-            edit_settings_redeemer = Redeemer(UpdateSettings())
+            edit_settings_redeemer = Redeemer(UPDATE_SETTINGS)
             builder = TransactionBuilder(self.chainquery.context)
             builder.add_script_input(
                 oraclefeed_utxo,
@@ -607,7 +692,7 @@ class OracleOwner:
                 redeemer=edit_settings_redeemer,
             )
 
-            oraclefeed_output = deepcopy(oraclefeed_utxo.output)
+            oraclefeed_output = clone_output(oraclefeed_utxo.output)
             oraclefeed_output.datum = OracleDatum(
                 price_data=PriceData.set_price_map(price=0, timestamp=0, expiry=0)
             )
@@ -639,9 +724,11 @@ class OracleOwner:
         self, aggstate_datum: AggDatum, nodes: List[bytes]
     ) -> AggDatum:
         """remove nodes to aggstate datum"""
-        for node in nodes:
-            if node in aggstate_datum.aggstate.ag_settings.os_node_list:
-                aggstate_datum.aggstate.ag_settings.os_node_list.remove(node)
+        settings = aggstate_datum.aggstate.ag_settings
+        removed = set(nodes)
+        settings.os_node_list = IndefiniteList(
+            [node for node in settings.os_node_list if node not in removed]
+        )
 
         return aggstate_datum
 
@@ -649,14 +736,20 @@ class OracleOwner:
         self, rewardstate_datum: RewardDatum, nodes: List[bytes]
     ) -> Tuple[RewardDatum, List[RewardInfo], int]:
         """remove nodes to rewardstate datum"""
-        nodes_removed = []
-        total_reward = 0
-        for node in nodes:
-            for node_reward in rewardstate_datum.reward_state.node_reward_list:
-                if node_reward.reward_address == node:
-                    rewardstate_datum.reward_state.node_reward_list.remove(node_reward)
-                    nodes_removed.append(node_reward)
-                    total_reward += node_reward.reward_amount
+        reward_state = rewardstate_datum.reward_state
+        removed = set(nodes)
+        nodes_kept: List[RewardInfo] = []
+        nodes_removed: List[RewardInfo] = []
+        for node_reward in reward_state.node_reward_list:
+            if node_reward.reward_address in removed:
+                nodes_removed.append(node_reward)
+            else:
+                nodes_kept.append(node_reward)
+        # Keep the list's CBOR shape, like _remove_nodes_from_aggstate does.
+        if isinstance(reward_state.node_reward_list, IndefiniteList):
+            nodes_kept = IndefiniteList(nodes_kept)
+        reward_state.node_reward_list = nodes_kept
+        total_reward = sum(node_reward.reward_amount for node_reward in nodes_removed)
         # TODO: Handle removing nodes payouts from rewardstate
         return rewardstate_datum, nodes_removed, total_reward
 
@@ -668,38 +761,67 @@ class OracleOwner:
         return aggstate_datum
 
     async def _get_eligible_nodes(
-        self, pkhs: List[bytes], operation: str
+        self,
+        pkhs: List[bytes],
+        operation: str,
+        aggstate_datum: Optional[AggDatum] = None,
     ) -> List[bytes]:
-        """Get eligible nodes to add or remove."""
+        """Get eligible nodes to add or remove.
+
+        The aggstate datum is fetched unless the caller already has it.
+        """
         eligible_nodes: List[bytes] = []
-        _, aggstate_datum = await self._get_aggstate_utxo_and_datum()
+        if aggstate_datum is None:
+            _, aggstate_datum = await self._get_aggstate_utxo_and_datum()
         node_list = aggstate_datum.aggstate.ag_settings.os_node_list
+        existing_nodes = set(node_list) if node_list is not None else set()
 
+        # The set is updated as nodes are taken so that a key repeated in
+        # pkhs is only added or removed once.
         for node in pkhs:
-            node_exists = check_node_exists(node_list, node)
-            if (operation == "add" and not node_exists) or (
-                operation == "remove" and node_exists
-            ):
+            node_exists = node in existing_nodes
+            if operation == "add" and not node_exists:
+                eligible_nodes.append(node)
+                existing_nodes.add(node)
+            elif operation == "remove" and node_exists:
                 eligible_nodes.append(node)
+                existing_nodes.discard(node)
 
         return eligible_nodes
 
-    async def _get_aggstate_utxo_and_datum(self) -> Tuple[UTxO, AggDatum]:
-        """Get aggstate utxo and datum."""
-        oracle_utxos = await self.chainquery.get_utxos(self.oracle_addr)
-        aggstate_utxo: UTxO = filter_utxos_by_asset(oracle_utxos, self.aggstate_nft)[0]
-        aggstate_datum: AggDatum = AggDatum.from_cbor(aggstate_utxo.output.datum.cbor)
+    async def _get_aggstate_utxo_and_datum(
+        self, oracle_utxos: Optional[List[UTxO]] = None
+    ) -> Tuple[UTxO, AggDatum]:
+        """Get aggstate utxo and datum, fetching the oracle UTxOs if not given."""
+        if oracle_utxos is None:
+            oracle_utxos = await self.chainquery.get_utxos(self.oracle_addr_str)
+        aggstate_utxo: UTxO = self._find_nft_utxo(oracle_utxos, self.aggstate_nft_key)
+        aggstate_datum: AggDatum = AggDatum.fast_from_cbor(
+            aggstate_utxo.output.datum.cbor
+        )
         return aggstate_utxo, aggstate_datum
 
-    async def _get_reward_utxo_and_datum(self) -> Tuple[UTxO, RewardDatum]:
-        """Get reward utxo and datum."""
-        oracle_utxos = await self.chainquery.get_utxos(self.oracle_addr)
-        rewardstate_utxo: UTxO = filter_utxos_by_asset(oracle_utxos, self.reward_nft)[0]
+    async def _get_reward_utxo_and_datum(
+        self, oracle_utxos: Optional[List[UTxO]] = None
+    ) -> Tuple[UTxO, RewardDatum]:
+        """Get reward utxo and datum, fetching the oracle UTxOs if not given."""
+        if oracle_utxos is None:
+            oracle_utxos = await self.chainquery.get_utxos(self.oracle_addr_str)
+        rewardstate_utxo: UTxO = self._find_nft_utxo(oracle_utxos, self.reward_nft_key)
         rewardstate_datum: RewardDatum = RewardDatum.from_cbor(
             rewardstate_utxo.output.datum.cbor
         )
         return rewardstate_utxo, rewardstate_datum
 
+    def _find_nft_utxo(
+        self, oracle_utxos: List[UTxO], key: Tuple[ScriptHash, AssetName]
+    ) -> UTxO:
+        """Return the first UTxO holding the NFT with the given key."""
+        for utxo in oracle_utxos:
+            if has_nft(utxo.output.amount.multi_asset, *key):
+                return utxo
+        raise IndexError(f"No oracle UTxO holds the NFT {key[1].payload!r}")
+
     def _prepare_builder(
         self,
         aggstate_utxo: UTxO,
@@ -712,14 +834,16 @@ class OracleOwner:
     ) -> TransactionBuilder:
         """Prepare transaction builder."""
         if not redeemer:
-            redeemer = Redeemer(UpdateSettings())
+            redeemer = Redeemer(UPDATE_SETTINGS)
         builder = TransactionBuilder(self.chainquery.context)
         builder.add_script_input(
-            utxo=aggstate_utxo, script=self.script_utxo, redeemer=deepcopy(redeemer)
+            utxo=aggstate_utxo,
+            script=self.script_utxo,
+            redeemer=Redeemer(redeemer.data),
         )
 
         if not aggstate_tx_output:
-            aggstate_tx_output = deepcopy(aggstate_utxo.output)
+            aggstate_tx_output = clone_output(aggstate_utxo.output)
             aggstate_tx_output.datum = updated_aggstate_datum
         builder.add_output(aggstate_tx_output)
 
@@ -728,7 +852,7 @@ class OracleOwner:
             builder.add_script_input(
                 utxo=reward_utxo,
                 script=self.script_utxo,
-                redeemer=deepcopy(redeemer),
+                redeemer=Redeemer(redeemer.data),
             )
             builder.add_output(updated_reward_utxo_output)
 
@@ -745,53 +869,43 @@ class OracleOwner:
             builder.native_scripts = [self.minting_script]
             builder.validity_start = self.validity_start
         else:
-            nft_minting_script = self.chainquery.get_plutus_script(self.nft_hash)
             builder.add_minting_script(
-                nft_minting_script, redeemer=Redeemer(MintToken())
+                self._nft_minting_script, redeemer=Redeemer(MINT_TOKEN)
             )
 
         builder.mint = mint_assets
 
     def _get_node_nfts(self, operation: str, eligible_nodes: int) -> MultiAsset:
         """Get node nfts in MultiAsset format."""
-        node_nfts = MultiAsset.from_primitive(
-            {
-                self.nft_hash.payload: {
-                    b"NodeFeed": (
-                        eligible_nodes if operation == "add" else -eligible_nodes
-                    )
-                }
-            }
-        )
-        return node_nfts
+        quantity = eligible_nodes if operation == "add" else -eligible_nodes
+        return MultiAsset({self.nft_hash: Asset({self.node_nft_name: quantity})})
 
     def _create_node_outputs(
         self, eligible_nodes: List[bytes]
     ) -> List[TransactionOutput]:
         """Create node outputs and return them as a list."""
-        node_outputs = []
-        for node in eligible_nodes:
-            node_datum = NodeDatum(
-                node_state=NodeState(ns_operator=node, ns_feed=Nothing())
-            )
-            node_output = TransactionOutput(
+        return [
+            TransactionOutput(
                 self.oracle_addr,
                 Value(2000000, self.single_node_nft),
-                datum=node_datum,
+                datum=NodeDatum(
+                    node_state=NodeState(ns_operator=node, ns_feed=Nothing())
+                ),
             )
-            node_outputs.append(node_output)
-        return node_outputs
+            for node in eligible_nodes
+        ]
 
     def _burn_node_nfts(
         self,
         eligible_nodes: List[bytes],
         builder: TransactionBuilder,
         redeemer: Redeemer,
+        oracle_utxos: List[UTxO],
     ):
-        oracle_utxos = self.chainquery.context.utxos(self.oracle_addr)
+        nodes_by_operator = index_node_utxos_by_operator(oracle_utxos, self.node_nft)
 
         for node in eligible_nodes:
-            node_utxo = get_node_own_utxo(oracle_utxos, self.node_nft, node)
+            node_utxo = nodes_by_operator[node]
             builder.add_script_input(
-                node_utxo, script=self.script_utxo, redeemer=deepcopy(redeemer)
+                node_utxo, script=self.script_utxo, redeemer=Redeemer(redeemer.data)
             )
@@ -22,7 +22,7 @@ from pycardano import (
     plutus_script_hash,
 )
 
-from charli3_offchain_core.chain_query import ChainQuery, StagedTxSubmitter
+from charli3_offchain_core.chain_query import ChainQuery
 from charli3_offchain_core.datums import (
     AggDatum,
     AggState,
@@ -36,6 +36,9 @@ from charli3_offchain_core.datums import (
     RewardInfo,
 )
 from charli3_offchain_core.owner_script import OwnerScript
+from charli3_offchain_core.utils.logging_config import logging
+
+logger = logging.getLogger("Oracle-Start")
 
 
 class OracleStart:
@@ -57,11 +60,7 @@ class OracleStart:
     ) -> None:
         self.network = network
         self.chain_query = chain_query
-        self.staged_query = StagedTxSubmitter(
-            chain_query.blockfrost_context,
-            chain_query.ogmios_context,
-            None,
-        )
+        self.staged_query = chain_query.staged_submitter()
         self.context = self.chain_query.context
         self.signing_key = signing_key
         self.verification_key = verification_key
@@ -106,7 +105,7 @@ class OracleStart:
         self, platform_multisig_pkhs: List[str], initial_c3_amount: int
     ) -> Transaction:
         """Start oracle"""
-        print(self.owner_script_hash)
+        logger.info("Owner script hash: %s", self.owner_script_hash)
         c3_asset = MultiAsset(
             {self.c3_token_hash: Asset({self.c3_token_name: initial_c3_amount})}
         )
@@ -121,53 +120,50 @@ class OracleStart:
             payment_part=self.owner_script_hash, network=self.network
         )
 
-        print(f"Locking script address: {owner_script_addr}")
-        print(f"Oracle script address: {self.oracle_address}")
-
-        print(self.context.utxos(self.address))
+        logger.info("Locking script address: %s", owner_script_addr)
+        logger.info("Oracle script address: %s", self.oracle_address)
 
         ############ Oracle NFT minting: ############
-        oracle_nfts = MultiAsset.from_primitive(
+        policy_id = self.owner_script_hash
+        node_name = AssetName(b"NodeFeed")
+        aggstate_name = AssetName(b"AggState")
+        oracle_name = AssetName(b"OracleFeed")
+        reward_name = AssetName(b"Reward")
+        oracle_nfts = MultiAsset(
             {
-                self.owner_script_hash.payload: {
-                    b"NodeFeed": len(
-                        self.node_pkh_list
-                    ),  # Negative sign indicates burning
-                    b"AggState": 1,
-                    b"OracleFeed": 1,
-                    b"Reward": 1,
-                }
+                policy_id: Asset(
+                    {
+                        node_name: len(self.node_pkh_list),
+                        aggstate_name: 1,
+                        oracle_name: 1,
+                        reward_name: 1,
+                    }
+                )
             }
         )
         builder.mint = oracle_nfts
-        single_node_nft = MultiAsset.from_primitive(
-            {self.owner_script_hash.payload: {b"NodeFeed": 1}}
-        )
-        oracle_nft = MultiAsset.from_primitive(
-            {self.owner_script_hash.payload: {b"OracleFeed": 1}}
-        )
-        aggstate_nft = MultiAsset.from_primitive(
-            {self.owner_script_hash.payload: {b"AggState": 1}}
-        )
-        reward_nft = MultiAsset.from_primitive(
-            {self.owner_script_hash.payload: {b"Reward": 1}}
-        )
+        single_node_nft = MultiAsset({policy_id: Asset({node_name: 1})})
+        oracle_nft = MultiAsset({policy_id: Asset({oracle_name: 1})})
+        aggstate_nft = MultiAsset({policy_id: Asset({aggstate_name: 1})})
+        reward_nft = MultiAsset({policy_id: Asset({reward_name: 1})})
         # Set native script
         builder.native_scripts = [self.owner_script]
 
-        node_reward_list = []
         # Prepare each datum
         for node in self.node_pkh_list:
-            node_datum = NodeDatum(
-                node_state=NodeState(ns_operator=node, ns_feed=Nothing())
+            builder.add_output(
+                TransactionOutput(
+                    self.oracle_address,
+                    Value(2000000, single_node_nft),
+                    datum=NodeDatum(
+                        node_state=NodeState(ns_operator=node, ns_feed=Nothing())
+                    ),
+                )
             )
-            node_reward_list.append(RewardInfo(reward_address=node, reward_amount=0))
-            node_output = TransactionOutput(
-                self.oracle_address,
-                Value(2000000, single_node_nft),
-                datum=node_datum,
-            )
-            builder.add_output(node_output)
+        node_reward_list = [
+            RewardInfo(reward_address=node, reward_amount=0)
+            for node in self.node_pkh_list
+        ]
 
         # Prepare oracle datum
         oracle_datum = OracleDatum(price_data=None)
@@ -204,9 +200,9 @@ class OracleStart:
         )
         builder.add_output(reward_output)
 
-        platform_multisig_vkhs = list(
-            map(VerificationKeyHash.from_primitive, platform_multisig_pkhs)
-        )
+        platform_multisig_vkhs = [
+            VerificationKeyHash.from_primitive(pkh) for pkh in platform_multisig_pkhs
+        ]
         builder.required_signers = platform_multisig_vkhs
 
         tx = await self.staged_query.build_tx(builder, self.signing_key, self.address)
@@ -5,71 +5,103 @@ from dataclasses import dataclass
 from pycardano import PlutusData
 
 
+class _Stateless:
+    """Redeemer without fields, shared as a single instance per class."""
+
+    _instance = None
+
+    def __new__(cls, *args, **kwargs):
+        # Look the instance up on the class itself, not on a base class.
+        instance = cls.__dict__.get("_instance")
+        if instance is None:
+            instance = super().__new__(cls)
+            cls._instance = instance
+        return instance
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+
 @dataclass
-class NodeUpdate(PlutusData):
+class NodeUpdate(_Stateless, PlutusData):
     """Node Update Redeemer"""
 
     CONSTR_ID = 0
 
 
 @dataclass
-class NodeCollect(PlutusData):
+class NodeCollect(_Stateless, PlutusData):
     """Node Collect Redeemer"""
 
     CONSTR_ID = 1
 
 
 @dataclass
-class PlatformCollect(PlutusData):
+class PlatformCollect(_Stateless, PlutusData):
     """Platform Collect Redeemer"""
 
     CONSTR_ID = 2
 
 
 @dataclass
-class Aggregate(PlutusData):
+class Aggregate(_Stateless, PlutusData):
     """Aggregate Redeemer"""
 
     CONSTR_ID = 3
 
 
 @dataclass
-class UpdateSettings(PlutusData):
+class UpdateSettings(_Stateless, PlutusData):
     """Update Settings Redeemer"""
 
     CONSTR_ID = 4
 
 
 @dataclass
-class AddNodes(PlutusData):
+class AddNodes(_Stateless, PlutusData):
     """Add nodes Redeemer"""
 
     CONSTR_ID = 5
 
 
 @dataclass
-class RemoveNodes(PlutusData):
+class RemoveNodes(_Stateless, PlutusData):
     """Remove nodes Redeemer"""
 
     CONSTR_ID = 6
 
 
 @dataclass
-class OracleClose(PlutusData):
+class OracleClose(_Stateless, PlutusData):
     """Oracle Close Redeemer"""
 
     CONSTR_ID = 7
 
 
 @dataclass
-class AddFunds(PlutusData):
+class AddFunds(_Stateless, PlutusData):
     """Top up contract redeemer"""
 
     CONSTR_ID = 8
 
 
 @dataclass
-class MintToken(PlutusData):
+class MintToken(_Stateless, PlutusData):
     """Mint Token Redeemer"""
 
     CONSTR_ID = 0
+
+
+NODE_UPDATE = NodeUpdate()
+NODE_COLLECT = NodeCollect()
+PLATFORM_COLLECT = PlatformCollect()
+AGGREGATE = Aggregate()
+UPDATE_SETTINGS = UpdateSettings()
+ADD_NODES = AddNodes()
+REMOVE_NODES = RemoveNodes()
+ORACLE_CLOSE = OracleClose()
+ADD_FUNDS = AddFunds()
+MINT_TOKEN = MintToken()
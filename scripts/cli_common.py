@@ -1,9 +1,20 @@
 import json
-from typing import List
+from typing import List, Mapping, Tuple
 
 import cbor2
 import click
-from pycardano import PlutusV2Script, Transaction
+from pycardano import (
+    BlockFrostChainContext,
+    ExtendedSigningKey,
+    HDWallet,
+    KupoOgmiosV6ChainContext,
+    Network,
+    PaymentVerificationKey,
+    PlutusV2Script,
+    Transaction,
+)
+
+from charli3_offchain_core.chain_query import ChainQuery
 
 # ANSI colors
 COLOR_RED = "\033[0;31m"
@@ -20,6 +31,66 @@ def collect_multisig_pkhs() -> List[str]:
     return platform_pkhs
 
 
+def build_chain_query(chain_query_config: Mapping, network: Network) -> ChainQuery:
+    """Build a ChainQuery from the blockfrost and ogmios sections of a
+    chain_query config, skipping the backends that are not configured.
+
+    An optional script_cache_dir keeps fetched Plutus scripts on disk, and an
+    optional utxo_cache_ttl_ms reuses UTxO queries for that many milliseconds."""
+    blockfrost_config = chain_query_config.get("blockfrost")
+    ogmios_config = chain_query_config.get("ogmios")
+
+    blockfrost_context = None
+    kupo_ogmios_context = None
+
+    if (
+        blockfrost_config
+        and blockfrost_config.get("api_url")
+        and blockfrost_config.get("project_id")
+    ):
+        blockfrost_context = BlockFrostChainContext(
+            blockfrost_config["project_id"],
+            base_url=blockfrost_config["api_url"],
+        )
+
+    if ogmios_config and ogmios_config.get("ws_url") and ogmios_config.get("kupo_url"):
+        _, ws_string = ogmios_config["ws_url"].split("ws://")
+        ws_url, port = ws_string.split(":")
+        kupo_ogmios_context = KupoOgmiosV6ChainContext(
+            host=ws_url,
+            port=int(port),
+            secure=False,
+            refetch_chain_tip_interval=None,
+            network=network,
+            kupo_url=ogmios_config["kupo_url"],
+        )
+
+    return ChainQuery(
+        blockfrost_context=blockfrost_context,
+        kupo_ogmios_context=kupo_ogmios_context,
+        script_cache_dir=chain_query_config.get("script_cache_dir"),
+        utxo_cache_ttl_ms=chain_query_config.get("utxo_cache_ttl_ms") or 0,
+    )
+
+
+def derive_owner_keys(
+    mnemonic: str,
+) -> Tuple[ExtendedSigningKey, PaymentVerificationKey, PaymentVerificationKey]:
+    """Derive the spend signing key and the spend and stake verification keys
+    of a mnemonic (m/1852'/1815'/0'/0/0 and m/1852'/1815'/0'/2/0).
+
+    The shared account node is derived once, and the HD wallets are dropped on
+    return so only the keys stay in memory."""
+    account = HDWallet.from_mnemonic(mnemonic).derive_from_path("m/1852'/1815'/0'")
+    hdwallet_spend = account.derive(0).derive(0)
+    hdwallet_stake = account.derive(2).derive(0)
+    return (
+        ExtendedSigningKey.from_hdwallet(hdwallet_spend),
+        PaymentVerificationKey.from_primitive(hdwallet_spend.public_key),
+        PaymentVerificationKey.from_primitive(hdwallet_stake.public_key),
+    )
+
+
 def write_tx_to_file(filename: str, tx: Transaction) -> None:
     with open(filename, "w") as f:
         tx_hex = tx.to_cbor().hex()
@@ -9,22 +9,17 @@ import click
 import yaml
 from pycardano import (
     Address,
+    Asset,
     AssetName,
-    BlockFrostChainContext,
-    ExtendedSigningKey,
-    HDWallet,
     IndefiniteList,
-    KupoOgmiosV6ChainContext,
     MultiAsset,
     Network,
-    PaymentVerificationKey,
     PlutusV2Script,
     ScriptHash,
     Transaction,
     VerificationKeyHash,
 )
 
-from charli3_offchain_core.chain_query import ChainQuery
 from charli3_offchain_core.datums import OraclePlatform, OracleSettings, PriceRewards
 from charli3_offchain_core.oracle_start import OracleStart
 from charli3_offchain_core.owner_script import OwnerScript
@@ -33,7 +28,9 @@ from charli3_offchain_core.utils.logging_config import logging
 from scripts.cli_common import (
     COLOR_DEFAULT,
     COLOR_RED,
+    build_chain_query,
     collect_multisig_pkhs,
+    derive_owner_keys,
     load_plutus_script,
     read_tx_from_file,
     write_tx_to_file,
@@ -174,56 +171,9 @@ def setup(ctx, config_file, script_path, is_local_image, image_name):
     elif config["network"] == "MAINNET":
         network = Network.MAINNET
 
-    chain_query_config = config.get("chain_query")
+    chain_query = build_chain_query(config.get("chain_query"), network)
 
-    blockfrost_config = chain_query_config.get("blockfrost")
-    ogmios_config = chain_query_config.get("ogmios")
-
-    blockfrost_context = None
-    kupo_ogmios_context = None
-
-    if (
-        blockfrost_config
-        and blockfrost_config.get("api_url")
-        and blockfrost_config.get("project_id")
-    ):
-        blockfrost_token = blockfrost_config["project_id"]
-        blockfrost_url = blockfrost_config["api_url"]
-        blockfrost_context = BlockFrostChainContext(
-            blockfrost_token,
-            base_url=blockfrost_url,
-        )
-
-    if ogmios_config and ogmios_config.get("ws_url") and ogmios_config.get("kupo_url"):
-        ogmios_ws_url = ogmios_config["ws_url"]
-        kupo_url = ogmios_config.get("kupo_url")
-
-        _, ws_string = ogmios_ws_url.split("ws://")
-        ws_url, port = ws_string.split(":")
-        kupo_ogmios_context = KupoOgmiosV6ChainContext(
-            host=ws_url,
-            port=int(port),
-            secure=False,
-            refetch_chain_tip_interval=None,
-            network=network,
-            kupo_url=kupo_url,
-        )
-
-    chain_query = ChainQuery(
-        blockfrost_context=blockfrost_context,
-        kupo_ogmios_context=kupo_ogmios_context,
-    )
-
-    hdwallet = HDWallet.from_mnemonic(mnemonic_24)
-    hdwallet_spend = hdwallet.derive_from_path("m/1852'/1815'/0'/0/0")
-    spend_public_key = hdwallet_spend.public_key
-    spend_vk = PaymentVerificationKey.from_primitive(spend_public_key)
-
-    hdwallet_stake = hdwallet.derive_from_path("m/1852'/1815'/0'/2/0")
-    stake_public_key = hdwallet_stake.public_key
-    stake_vk = PaymentVerificationKey.from_primitive(stake_public_key)
-
-    extended_signing_key = ExtendedSigningKey.from_hdwallet(hdwallet_spend)
+    extended_signing_key, spend_vk, stake_vk = derive_owner_keys(mnemonic_24)
     owner_addr = Address(spend_vk.hash(), stake_vk.hash(), network)
     oracle_platform = OraclePlatform(
         pmultisig_pkhs=IndefiniteList(
@@ -372,8 +322,8 @@ def parse_and_check_tx_interactively(
     filename = click.prompt("Enter filename containing tx cbor")
     tx = read_tx_from_file(filename)
     allow_own_inputs = False
-    aggstate_nft = MultiAsset.from_primitive(
-        {oracle_start.owner_script_hash.payload: {b"AggState": 1}}
+    aggstate_nft = MultiAsset(
+        {oracle_start.owner_script_hash: Asset({AssetName(b"AggState"): 1})}
     )
     tx_validator = TxValidator(
         oracle_start.network,
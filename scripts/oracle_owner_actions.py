@@ -7,11 +7,8 @@ import click
 import yaml
 from pycardano import (
     Address,
+    Asset,
     AssetName,
-    BlockFrostChainContext,
-    ExtendedSigningKey,
-    HDWallet,
-    KupoOgmiosV6ChainContext,
     MultiAsset,
     Network,
     PaymentSigningKey,
@@ -23,7 +20,6 @@ from pycardano import (
     VerificationKeyHash,
 )
 
-from charli3_offchain_core.chain_query import ChainQuery
 from charli3_offchain_core.oracle_owner import OracleOwner
 from charli3_offchain_core.owner_script import OwnerScript
 from charli3_offchain_core.tx_validation import TxValidationException, TxValidator
@@ -31,7 +27,9 @@ from charli3_offchain_core.utils.logging_config import logging
 from scripts.cli_common import (
     COLOR_DEFAULT,
     COLOR_RED,
+    build_chain_query,
     collect_multisig_pkhs,
+    derive_owner_keys,
     load_plutus_script,
     read_tx_from_file,
     write_tx_to_file,
@@ -59,16 +57,7 @@ def setup(ctx, config_file):
 
     if oracle_owner_config["MNEMONIC_24"]:
         MNEMONIC_24 = oracle_owner_config["MNEMONIC_24"]
-        hdwallet = HDWallet.from_mnemonic(MNEMONIC_24)
-        hdwallet_spend = hdwallet.derive_from_path("m/1852'/1815'/0'/0/0")
-        spend_public_key = hdwallet_spend.public_key
-        spend_vk = PaymentVerificationKey.from_primitive(spend_public_key)
-
-        hdwallet_stake = hdwallet.derive_from_path("m/1852'/1815'/0'/2/0")
-        stake_public_key = hdwallet_stake.public_key
-        stake_vk = PaymentVerificationKey.from_primitive(stake_public_key)
-
-        spend_sk = ExtendedSigningKey.from_hdwallet(hdwallet_spend)
+        spend_sk, spend_vk, stake_vk = derive_owner_keys(MNEMONIC_24)
 
     elif oracle_owner_config["payment_vk"] and oracle_owner_config["payment_sk"]:
         spend_sk = PaymentSigningKey.load(
@@ -87,46 +76,7 @@ def setup(ctx, config_file):
     if oracle_owner_config["network"] == "testnet":
         network = Network.TESTNET
 
-    chain_query_config = oracle_owner_config["chain_query"]
-
-    blockfrost_config = chain_query_config.get("blockfrost")
-    ogmios_config = chain_query_config.get("ogmios")
-
-    blockfrost_context = None
-    kupo_ogmios_context = None
-
-    if (
-        blockfrost_config
-        and blockfrost_config.get("api_url")
-        and blockfrost_config.get("project_id")
-    ):
-        blockfrost_token = blockfrost_config["project_id"]
-        blockfrost_url = blockfrost_config["api_url"]
-        blockfrost_context = BlockFrostChainContext(
-            blockfrost_token,
-            base_url=blockfrost_url,
-        )
-
-    if ogmios_config and ogmios_config.get("ws_url") and ogmios_config.get("kupo_url"):
-        ogmios_ws_url = ogmios_config["ws_url"]
-        kupo_url = ogmios_config.get("kupo_url")
-
-        _, ws_string = ogmios_ws_url.split("ws://")
-        ws_url, port = ws_string.split(":")
-
-        kupo_ogmios_context = KupoOgmiosV6ChainContext(
-            host=ws_url,
-            port=int(port),
-            secure=False,
-            refetch_chain_tip_interval=None,
-            network=network,
-            kupo_url=kupo_url,
-        )
-
-    chain_query = ChainQuery(
-        blockfrost_context=blockfrost_context,
-        kupo_ogmios_context=kupo_ogmios_context,
-    )
+    chain_query = build_chain_query(oracle_owner_config["chain_query"], network)
 
     owner_addr = Address(spend_vk.hash(), stake_vk.hash(), network)
     oracle_addr = oracle_owner_config["oracle_owner"]["oracle_addr"]
@@ -138,10 +88,10 @@ def setup(ctx, config_file):
     c3_token_name = AssetName(
         oracle_owner_config["oracle_owner"]["c3_token_name"].encode()
     )
-    node_nft = MultiAsset.from_primitive({nft_hash: {b"NodeFeed": 1}})
-    aggstate_nft = MultiAsset.from_primitive({nft_hash: {b"AggState": 1}})
-    oracle_nft = MultiAsset.from_primitive({nft_hash: {b"OracleFeed": 1}})
-    reward_nft = MultiAsset.from_primitive({nft_hash: {b"Reward": 1}})
+    node_nft, aggstate_nft, oracle_nft, reward_nft = (
+        MultiAsset({minting_nft_hash: Asset({AssetName(name): 1})})
+        for name in (b"NodeFeed", b"AggState", b"OracleFeed", b"Reward")
+    )
     script_start_slot = oracle_owner_config["oracle_owner"]["script_start_slot"]
     oracle_platform = oracle_owner_config["oracle_owner"]["oracle_platform"]
     native_script = OwnerScript(
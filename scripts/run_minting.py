@@ -26,16 +26,24 @@ blockfrost_context = BlockFrostChainContext(
 context = ChainQuery(
     blockfrost_context,
 )
-# TODO: Add your node keys here
-node_signing_key = PaymentSigningKey.load("path/to/your/node.skey")
-node_verification_key = PaymentVerificationKey.load("path/to/your/node.vkey")
-node_pub_key_hash = node_verification_key.hash()
-node_address = Address(payment_part=node_pub_key_hash, network=network)
-with open("../plutus-scripts/mint_script.plutus", "r") as f:
-    script_hex = f.read()
-    plutus_script_v2 = PlutusV2Script(cbor2.loads(bytes.fromhex(script_hex)))
-
-c3_token = Mint(
-    network, context, node_signing_key, node_verification_key, plutus_script_v2
-)
-asyncio.run(c3_token.mint_nft_with_script())
+
+
+async def main():
+    """Mint tokens with the plutus minting script."""
+    # TODO: Add your node keys here
+    node_signing_key = PaymentSigningKey.load("path/to/your/node.skey")
+    node_verification_key = PaymentVerificationKey.load("path/to/your/node.vkey")
+    node_pub_key_hash = node_verification_key.hash()
+    node_address = Address(payment_part=node_pub_key_hash, network=network)
+    with open("../plutus-scripts/mint_script.plutus", "r") as f:
+        script_hex = f.read()
+        plutus_script_v2 = PlutusV2Script(cbor2.loads(bytes.fromhex(script_hex)))
+
+    c3_token = Mint(
+        network, context, node_signing_key, node_verification_key, plutus_script_v2
+    )
+    await c3_token.mint_nft_with_script()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
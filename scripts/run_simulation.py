@@ -1,16 +1,16 @@
 """Run simulation of the C3 protocol."""
 
 import asyncio
-from typing import Union
+import functools
+from typing import Tuple, Union
 
 import yaml
 from pycardano import (
     Address,
+    Asset,
     AssetName,
-    BlockFrostChainContext,
     ExtendedSigningKey,
     HDWallet,
-    KupoOgmiosV6ChainContext,
     MultiAsset,
     Network,
     PaymentVerificationKey,
@@ -19,8 +19,8 @@ from pycardano import (
     TransactionInput,
 )
 
-from charli3_offchain_core.chain_query import ChainQuery
 from charli3_offchain_core.node import Node
+from scripts.cli_common import build_chain_query
 
 with open("run-node-simulator.yml", "r", encoding="utf-8") as stream:
     config = yaml.safe_load(stream)
@@ -29,60 +29,23 @@ network = Network.MAINNET
 if config["network"] == "testnet":
     network = Network.TESTNET
 
-chain_query_config = config["chain_query"]
-
-blockfrost_config = chain_query_config.get("blockfrost")
-ogmios_config = chain_query_config.get("ogmios")
-
-blockfrost_context = None  # pylint: disable=invalid-name
-kupo_ogmios_context = None  # pylint: disable=invalid-name
-
-if (
-    blockfrost_config
-    and blockfrost_config.get("api_url")
-    and blockfrost_config.get("project_id")
-):
-    blockfrost_token = blockfrost_config["project_id"]
-    blockfrost_url = blockfrost_config["api_url"]
-    blockfrost_context = BlockFrostChainContext(
-        blockfrost_token,
-        base_url=blockfrost_url,
-    )
-
-if ogmios_config and ogmios_config.get("ws_url") and ogmios_config.get("kupo_url"):
-    ogmios_ws_url = ogmios_config["ws_url"]
-    kupo_url = ogmios_config.get("kupo_url")
-    _, ws_string = ogmios_ws_url.split("ws://")
-    ws_url, port = ws_string.split(":")
-    kupo_ogmios_context = KupoOgmiosV6ChainContext(
-        host=ws_url,
-        port=int(port),
-        secure=False,
-        refetch_chain_tip_interval=None,
-        network=network,
-        kupo_url=kupo_url,
-    )
-
-chain_query = ChainQuery(
-    blockfrost_context=blockfrost_context,
-    kupo_ogmios_context=kupo_ogmios_context,
-)
-nft_hash = config["oracle_info"]["minting_nft_hash"]
+chain_query = build_chain_query(config["chain_query"], network)
+nft_hash = ScriptHash.from_primitive(config["oracle_info"]["minting_nft_hash"])
 
 oracle_addr = Address.from_primitive(config["oracle_info"]["oracle_addr"])
 oracle_script_hash = oracle_addr.payment_part
 
-node_nft = MultiAsset.from_primitive({nft_hash: {b"NodeFeed": 1}})
-aggstate_nft = MultiAsset.from_primitive({nft_hash: {b"AggState": 1}})
-oracle_nft = MultiAsset.from_primitive({nft_hash: {b"OracleFeed": 1}})
-reward_nft = MultiAsset.from_primitive({nft_hash: {b"Reward": 1}})
+node_nft, aggstate_nft, oracle_nft, reward_nft = (
+    MultiAsset({nft_hash: Asset({AssetName(name): 1})})
+    for name in (b"NodeFeed", b"AggState", b"OracleFeed", b"Reward")
+)
 
 
 def create_c3_oracle_rate_nft(token_name, minting_policy) -> Union[MultiAsset, None]:
     """Create C3 oracle rate NFT."""
     if token_name and minting_policy:
-        return MultiAsset.from_primitive(
-            {minting_policy.payload: {bytes(token_name, "utf-8"): 1}}
+        return MultiAsset(
+            {minting_policy: Asset({AssetName(token_name.encode("utf-8")): 1})}
         )
     else:
         return None
@@ -135,17 +98,28 @@ if (
 else:
     reference_script_input = None  # pylint: disable=invalid-name
 
+
+@functools.lru_cache(maxsize=None)
+def derive_node_keys(
+    mnemonic: str,
+) -> Tuple[ExtendedSigningKey, PaymentVerificationKey]:
+    """Derive the payment keys of a mnemonic, once per mnemonic.
+
+    Only the keys are cached, the HD wallet and its seed are dropped."""
+    hdwallet = HDWallet.from_mnemonic(mnemonic)
+    hdwallet_spend = hdwallet.derive_from_path("m/1852'/1815'/0'/0/0")
+    return (
+        ExtendedSigningKey.from_hdwallet(hdwallet_spend),
+        PaymentVerificationKey.from_primitive(hdwallet_spend.public_key),
+    )
+
+
 updates = config["updates"]
 
 nodes = []
 for i, update in enumerate(updates):
-    hdwallet = HDWallet.from_mnemonic(update["mnemonic"])
-    hdwallet_spend = hdwallet.derive_from_path("m/1852'/1815'/0'/0/0")
-    spend_public_key = hdwallet_spend.public_key
-    node_verification_key = PaymentVerificationKey.from_primitive(spend_public_key)
+    node_signing_key, node_verification_key = derive_node_keys(update["mnemonic"])
     node_pub_key_hash = node_verification_key.hash()
-
-    node_signing_key = ExtendedSigningKey.from_hdwallet(hdwallet_spend)
     owner_addr = Address(node_pub_key_hash, network=network)
 
     node = Node(
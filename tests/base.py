@@ -0,0 +1,120 @@
+"""Shared builders for the offline unit tests."""
+
+from typing import List, Optional, Union
+from unittest.mock import MagicMock
+
+from pycardano import (
+    Address,
+    Asset,
+    AssetName,
+    BlockFrostChainContext,
+    MultiAsset,
+    Network,
+    RawCBOR,
+    ScriptHash,
+    TransactionId,
+    TransactionInput,
+    TransactionOutput,
+    UTxO,
+    Value,
+)
+
+from charli3_offchain_core.chain_query import ChainQuery
+from charli3_offchain_core.datums import (
+    DataFeed,
+    NodeDatum,
+    NodeState,
+    Nothing,
+    OracleReward,
+    PriceFeed,
+    RewardDatum,
+    RewardInfo,
+)
+
+NETWORK = Network.TESTNET
+NFT_POLICY = ScriptHash(bytes(range(28)))
+C3_POLICY = ScriptHash(bytes([9]) * 28)
+C3_NAME = AssetName(b"C3")
+ORACLE_ADDR = Address(ScriptHash(bytes(28)), network=NETWORK)
+
+
+def nft(name: bytes) -> MultiAsset:
+    """Single oracle NFT with the given asset name."""
+    return MultiAsset({NFT_POLICY: Asset({AssetName(name): 1})})
+
+
+def c3(amount: int) -> MultiAsset:
+    """C3 payment tokens."""
+    return MultiAsset({C3_POLICY: Asset({C3_NAME: amount})})
+
+
+def make_utxo(
+    index: int,
+    multi_asset: Optional[MultiAsset] = None,
+    datum=None,
+    coin: int = 2000000,
+    address: Address = ORACLE_ADDR,
+) -> UTxO:
+    """UTxO with a distinct transaction id per index."""
+    return UTxO(
+        TransactionInput(TransactionId(bytes([index]) * 32), 0),
+        TransactionOutput(
+            address, Value(coin, multi_asset or MultiAsset()), datum=datum
+        ),
+    )
+
+
+def node_datum(operator: bytes, value: Optional[int] = None) -> NodeDatum:
+    """Node datum with a price feed, or Nothing when no value is given."""
+    feed = Nothing() if value is None else PriceFeed(DataFeed(value, 1000))
+    return NodeDatum(NodeState(ns_operator=operator, ns_feed=feed))
+
+
+def node_utxo(
+    index: int, operator: bytes, value: Optional[int] = None, raw: bool = True
+) -> UTxO:
+    """Node UTxO holding the NodeFeed NFT, with its datum as raw CBOR by default."""
+    datum = node_datum(operator, value)
+    return make_utxo(
+        index, nft(b"NodeFeed"), RawCBOR(datum.to_cbor()) if raw else datum
+    )
+
+
+def reward_utxo(
+    index: int, rewards: List[RewardInfo], platform_reward: int = 0
+) -> UTxO:
+    """Reward UTxO holding the Reward NFT and the C3 owed to everyone."""
+    datum = RewardDatum(OracleReward(rewards, platform_reward))
+    total = sum(r.reward_amount for r in rewards) + platform_reward
+    return make_utxo(index, nft(b"Reward") + c3(total), RawCBOR(datum.to_cbor()))
+
+
+def make_chain_query(utxos: Union[List[UTxO], None] = None, **kwargs) -> ChainQuery:
+    """ChainQuery over a mocked Blockfrost context returning the given UTxOs."""
+    context = MagicMock(spec=BlockFrostChainContext)
+    context.utxos.return_value = utxos or []
+    # Set in BlockFrostChainContext.__init__, so the spec does not include it.
+    context.api = MagicMock()
+    return ChainQuery(blockfrost_context=context, **kwargs)
+
+
+class FakeBuilder:
+    """Records what a transaction builder is asked to add."""
+
+    def __init__(self, context=None):
+        self.inputs = []
+        self.outputs = []
+        self.reference_inputs = set()
+        self.collaterals = []
+
+    def add_script_input(self, utxo, script=None, redeemer=None, **kwargs):
+        self.inputs.append((utxo, redeemer))
+        return self
+
+    def add_input(self, utxo):
+        self.inputs.append((utxo, None))
+        return self
+
+    def add_output(self, output, **kwargs):
+        self.outputs.append(output)
+        return self
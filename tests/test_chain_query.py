@@ -0,0 +1,348 @@
+"""Offline tests for ChainQuery."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from pycardano import (
+    Address,
+    DatumHash,
+    PaymentSigningKey,
+    PlutusV2Script,
+    RawCBOR,
+    Transaction,
+    TransactionBody,
+    TransactionInput,
+    TransactionOutput,
+    TransactionWitnessSet,
+    plutus_script_hash,
+)
+
+from charli3_offchain_core import chain_query as chain_query_module
+from charli3_offchain_core.chain_query import ChainQuery
+
+from .base import (
+    NETWORK,
+    ORACLE_ADDR,
+    make_chain_query,
+    make_utxo,
+    nft,
+    node_datum,
+    node_utxo,
+)
+
+
+class FakeClock:
+    """Monotonic clock that only moves when told to."""
+
+    def __init__(self):
+        self.now_ms = 1_000_000
+
+    def monotonic_ns(self) -> int:
+        return self.now_ms * 1_000_000
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(chain_query_module.time, "monotonic_ns", fake.monotonic_ns)
+    return fake
+
+
+CACHE_TTL_MS = 2000
+
+
+def cached_query() -> ChainQuery:
+    """ChainQuery over one node UTxO, with the UTxO cache turned on."""
+    return make_chain_query([node_utxo(1, b"a" * 28)], utxo_cache_ttl_ms=CACHE_TTL_MS)
+
+
+class TestUtxoCache:
+    async def test_reuses_recent_query(self, clock):
+        chain_query = cached_query()
+
+        await chain_query.get_utxos(ORACLE_ADDR)
+        clock.now_ms += chain_query.utxo_cache_ttl_ms - 1
+        await chain_query.get_utxos(str(ORACLE_ADDR))
+
+        assert chain_query.blockfrost_context.utxos.call_count == 1
+
+    async def test_expires_after_ttl(self, clock):
+        chain_query = cached_query()
+
+        await chain_query.get_utxos(ORACLE_ADDR)
+        clock.now_ms += chain_query.utxo_cache_ttl_ms
+        await chain_query.get_utxos(ORACLE_ADDR)
+
+        assert chain_query.blockfrost_context.utxos.call_count == 2
+
+    async def test_off_by_default(self, clock):
+        chain_query = make_chain_query([node_utxo(1, b"a" * 28)])
+
+        await chain_query.get_utxos(ORACLE_ADDR)
+        await chain_query.get_utxos(ORACLE_ADDR)
+
+        assert chain_query.blockfrost_context.utxos.call_count == 2
+
+    @pytest.mark.parametrize("address", [None, ORACLE_ADDR])
+    async def test_invalidate(self, clock, address):
+        chain_query = cached_query()
+
+        await chain_query.get_utxos(ORACLE_ADDR)
+        chain_query.invalidate_utxo_cache(address)
+        await chain_query.get_utxos(ORACLE_ADDR)
+
+        assert chain_query.blockfrost_context.utxos.call_count == 2
+
+    async def test_invalidate_other_address_keeps_entry(self, clock):
+        chain_query = cached_query()
+
+        await chain_query.get_utxos(ORACLE_ADDR)
+        chain_query.invalidate_utxo_cache("addr_test1_other")
+        await chain_query.get_utxos(ORACLE_ADDR)
+
+        assert chain_query.blockfrost_context.utxos.call_count == 1
+
+    async def test_returned_outputs_do_not_leak_into_cache(self, clock):
+        chain_query = cached_query()
+
+        first = await chain_query.get_utxos(ORACLE_ADDR)
+        first[0].output.datum = node_datum(b"a" * 28)
+        first.clear()
+        second = await chain_query.get_utxos(ORACLE_ADDR)
+
+        assert len(second) == 1
+        assert isinstance(second[0].output.datum, RawCBOR)
+        assert second[0].input == node_utxo(1, b"a" * 28).input
+
+    async def test_staged_submitter_shares_cache(self, clock):
+        chain_query = cached_query()
+        staged = chain_query.staged_submitter(str(ORACLE_ADDR))
+
+        await staged.get_utxos(ORACLE_ADDR)
+        await chain_query.get_utxos(ORACLE_ADDR)
+        assert chain_query.blockfrost_context.utxos.call_count == 1
+
+        chain_query._submit_tx(make_tx("tx1"))
+        await staged.get_utxos(ORACLE_ADDR)
+        assert chain_query.blockfrost_context.utxos.call_count == 2
+        assert staged.utxo_cache_ttl_ms == CACHE_TTL_MS
+
+    def test_staged_submitter_keeps_script_cache_dir(self, tmp_path):
+        chain_query = make_chain_query(script_cache_dir=str(tmp_path))
+
+        assert chain_query.staged_submitter().script_cache_dir == str(tmp_path)
+
+
+class TestNodeDatumsWithUtxo:
+    def test_decodes_inline_datums_without_fetching(self):
+        chain_query = make_chain_query()
+        raw = node_utxo(1, b"a" * 28, 5)
+        decoded = node_utxo(2, b"b" * 28, raw=False)
+        datum = decoded.output.datum
+
+        result = chain_query.get_node_datums_with_utxo([raw, decoded])
+
+        assert result == [raw, decoded]
+        assert raw.output.datum == node_datum(b"a" * 28, 5)
+        assert decoded.output.datum is datum
+        chain_query.blockfrost_context.api.script_datum_cbor.assert_not_called()
+
+    def test_fetches_hashed_datums(self):
+        chain_query = make_chain_query()
+        cbor = node_datum(b"a" * 28, 5).to_cbor()
+        chain_query.blockfrost_context.api.script_datum_cbor.return_value.cbor = cbor
+        hashed = make_utxo(1, nft(b"NodeFeed"))
+        hashed.output.datum_hash = DatumHash(bytes(32))
+
+        result = chain_query.get_node_datums_with_utxo(
+            [hashed, node_utxo(2, b"b" * 28)]
+        )
+
+        assert result[0].output.datum == node_datum(b"a" * 28, 5)
+        chain_query.blockfrost_context.api.script_datum_cbor.assert_called_once()
+
+    def test_skips_utxos_without_assets(self):
+        chain_query = make_chain_query()
+        node = node_utxo(2, b"b" * 28)
+
+        assert chain_query.get_node_datums_with_utxo([make_utxo(1), node]) == [node]
+
+
+def make_tx(tx_id: str) -> MagicMock:
+    """Transaction stand-in with the id and CBOR used by the submit path."""
+    tx = MagicMock()
+    tx.id = tx_id
+    tx.to_cbor.return_value = tx_id.encode()
+    return tx
+
+
+class TestSubmit:
+    async def test_submit_tx_async_keeps_task_until_done(self):
+        chain_query = make_chain_query()
+        confirmed = asyncio.Event()
+
+        async def wait_for_tx(tx_id):
+            await confirmed.wait()
+            return "success", None
+
+        chain_query.wait_for_tx = wait_for_tx
+        tx = make_tx("tx1")
+
+        task = await chain_query.submit_tx_async(tx)
+
+        chain_query.blockfrost_context.submit_tx.assert_called_once_with(b"tx1")
+        assert task in chain_query._confirmation_tasks
+        confirmed.set()
+        assert await task == ("success", tx)
+        await asyncio.sleep(0)
+        assert not chain_query._confirmation_tasks
+
+    async def test_submit_tx_async_logs_unawaited_failure(self, caplog):
+        chain_query = make_chain_query()
+        chain_query.wait_for_tx = AsyncMock(side_effect=RuntimeError("node down"))
+
+        await chain_query.submit_tx_async(make_tx("tx1"))
+        while chain_query._confirmation_tasks:
+            await asyncio.sleep(0)
+
+        assert "node down" in caplog.text
+
+    async def test_submit_many_reports_each_transaction(self):
+        chain_query = make_chain_query()
+        chain_query.blockfrost_context.submit_tx.side_effect = [
+            None,
+            RuntimeError("rejected"),
+            None,
+        ]
+        chain_query.wait_for_tx = AsyncMock(return_value=("success", None))
+        txs = [make_tx(f"tx{i}") for i in range(3)]
+
+        results = await chain_query.submit_many(txs)
+
+        error, failed_tx = results[1]
+        assert results[0] == ("success", txs[0])
+        assert results[2] == ("success", txs[2])
+        assert isinstance(error, RuntimeError) and str(error) == "rejected"
+        assert error.__traceback__ is not None
+        assert failed_tx is txs[1]
+        assert chain_query.blockfrost_context.submit_tx.call_count == 3
+
+
+SCRIPT = PlutusV2Script(bytes.fromhex("4e4d01000033222220051200120011"))
+SCRIPT_HASH = plutus_script_hash(SCRIPT)
+
+
+class TestScriptCache:
+    @pytest.fixture
+    def cache_dir(self, tmp_path):
+        return tmp_path / "scripts"
+
+    def make(self, cache_dir):
+        """ChainQuery whose Blockfrost context serves SCRIPT."""
+        chain_query = make_chain_query(script_cache_dir=cache_dir and str(cache_dir))
+        chain_query.blockfrost_context._get_script.return_value = SCRIPT
+        return chain_query
+
+    def cached_file(self, cache_dir):
+        return cache_dir / f"{SCRIPT_HASH}.plutus"
+
+    async def test_fetched_script_is_written(self, cache_dir):
+        chain_query = self.make(cache_dir)
+
+        assert await chain_query.get_plutus_script(SCRIPT_HASH) == SCRIPT
+
+        assert self.cached_file(cache_dir).read_bytes() == bytes(SCRIPT)
+        assert list(cache_dir.iterdir()) == [self.cached_file(cache_dir)]
+
+    async def test_cached_script_is_read_without_fetching(self, cache_dir):
+        await self.make(cache_dir).get_plutus_script(SCRIPT_HASH)
+        chain_query = self.make(cache_dir)
+
+        assert await chain_query.get_plutus_script(SCRIPT_HASH) == SCRIPT
+
+        chain_query.blockfrost_context._get_script.assert_not_called()
+
+    async def test_corrupt_file_is_refetched_and_replaced(self, cache_dir, caplog):
+        cache_dir.mkdir()
+        self.cached_file(cache_dir).write_bytes(b"garbage")
+        chain_query = self.make(cache_dir)
+
+        assert await chain_query.get_plutus_script(SCRIPT_HASH) == SCRIPT
+
+        assert "wrong hash" in caplog.text
+        chain_query.blockfrost_context._get_script.assert_called_once()
+        assert self.cached_file(cache_dir).read_bytes() == bytes(SCRIPT)
+
+    async def test_unwritable_cache_still_returns_script(self, cache_dir, caplog):
+        cache_dir.write_bytes(b"not a directory")
+        chain_query = self.make(cache_dir)
+
+        assert await chain_query.get_plutus_script(SCRIPT_HASH) == SCRIPT
+
+        assert "could not cache script" in caplog.text
+
+    async def test_disabled_without_directory(self, cache_dir, monkeypatch):
+        monkeypatch.chdir(cache_dir.parent)
+        chain_query = self.make(None)
+
+        assert await chain_query.get_plutus_script(SCRIPT_HASH) == SCRIPT
+
+        assert list(cache_dir.parent.iterdir()) == []
+
+
+OWNER_KEY = PaymentSigningKey(bytes([1]) * 32)
+OWNER_ADDR = Address(OWNER_KEY.to_verification_key().hash(), network=NETWORK)
+
+
+def signed_tx(outputs) -> Transaction:
+    """Signed transaction paying to the given outputs."""
+    body = TransactionBody(inputs=[make_utxo(1).input], outputs=outputs, fee=1)
+    return Transaction(body, TransactionWitnessSet())
+
+
+class TestCreateCollateral:
+    @pytest.fixture
+    def builder(self, monkeypatch):
+        builder_class = MagicMock()
+        monkeypatch.setattr(chain_query_module, "TransactionBuilder", builder_class)
+        builder = builder_class.return_value
+        builder.outputs = []
+        builder.add_output.side_effect = builder.outputs.append
+        return builder
+
+    async def create(self, builder, outputs, status="success"):
+        """Create a 5 ADA collateral, with the builder paying to outputs."""
+        chain_query = make_chain_query()
+        tx = builder.build_and_sign.return_value = signed_tx(outputs)
+        chain_query.submit_tx_with_print = AsyncMock(return_value=(status, tx))
+        return await chain_query.create_collateral(OWNER_ADDR, OWNER_KEY, 5000000)
+
+    async def test_returns_the_collateral_output(self, builder):
+        collateral = TransactionOutput(OWNER_ADDR, 5000000)
+        change = TransactionOutput(OWNER_ADDR, 9000000)
+
+        utxo = await self.create(builder, [collateral, change])
+
+        tx = builder.build_and_sign.return_value
+        assert utxo.input == TransactionInput(tx.id, 0)
+        assert utxo.output == collateral
+        assert builder.outputs == [collateral]
+
+    async def test_ignores_equal_outputs_elsewhere(self, builder):
+        outputs = [
+            TransactionOutput(OWNER_ADDR, 4000000),
+            TransactionOutput(OWNER_ADDR, 5000000),
+        ]
+
+        assert await self.create(builder, outputs) is None
+
+    async def test_failed_submit(self, builder):
+        outputs = [TransactionOutput(OWNER_ADDR, 5000000)]
+
+        assert await self.create(builder, outputs, status="timeout") is None
+
+    async def test_no_matching_output(self, builder):
+        outputs = [TransactionOutput(OWNER_ADDR, 4000000)]
+
+        assert await self.create(builder, outputs) is None
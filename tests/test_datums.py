@@ -0,0 +1,165 @@
+"""Offline tests for the layout-specific datum codecs."""
+
+from dataclasses import dataclass
+
+import cbor2
+import pytest
+from pycardano import IndefiniteList, PlutusData
+
+from charli3_offchain_core.datums import (
+    AggDatum,
+    AggState,
+    DataFeed,
+    NodeDatum,
+    NodeState,
+    Nothing,
+    OraclePlatform,
+    OracleSettings,
+    PriceFeed,
+    PriceRewards,
+)
+
+from .base import node_datum
+
+OPERATOR = b"a" * 28
+
+
+@dataclass
+class GenericNodeDatum(PlutusData):
+    """NodeDatum without the fast paths, encoded by the generic PlutusData code."""
+
+    CONSTR_ID = NodeDatum.CONSTR_ID
+    node_state: NodeState
+
+
+def agg_datum(node_list=(OPERATOR, b"b" * 28)) -> AggDatum:
+    """AggDatum with distinct values in every settings field."""
+    return AggDatum(
+        AggState(
+            OracleSettings(
+                os_node_list=IndefiniteList(list(node_list)),
+                os_updated_nodes=6000,
+                os_updated_node_time=100000,
+                os_aggregate_time=1000,
+                os_aggregate_change=100,
+                os_minimum_deposit=1,
+                os_aggregate_valid_range=2,
+                os_node_fee_price=PriceRewards(10, 5, 2),
+                os_iqr_multiplier=20000,
+                os_divergence=2000,
+                os_platform=OraclePlatform(IndefiniteList([b"p" * 28]), 1),
+            )
+        )
+    )
+
+
+@pytest.fixture(params=[None, 42, 0, 2**70], ids=["nothing", "price", "zero", "big"])
+def datum(request) -> NodeDatum:
+    return node_datum(OPERATOR, request.param)
+
+
+class TestNodeDatumEncoding:
+    def test_cbor_matches_generic_encoding(self, datum):
+        generic = GenericNodeDatum(datum.node_state)
+
+        assert datum.to_cbor() == generic.to_cbor()
+
+    def test_round_trip(self, datum):
+        assert NodeDatum.from_cbor(datum.to_cbor()) == datum
+
+    def test_unknown_layout_uses_generic_encoding(self):
+        state = NodeState(ns_operator=OPERATOR, ns_feed=DataFeed(1, 2))
+
+        generic = GenericNodeDatum(state).to_primitive()
+
+        assert NodeDatum(state).to_primitive() == generic
+
+
+class TestNodeDatumFastDecoding:
+    def test_matches_generic_decoding(self, datum):
+        cbor = datum.to_cbor()
+
+        decoded = NodeDatum.fast_from_cbor(cbor)
+
+        assert decoded == NodeDatum.from_cbor(cbor)
+        assert decoded.to_cbor() == cbor
+
+    def test_feed_types(self):
+        price = NodeDatum.fast_from_cbor(node_datum(OPERATOR, 7).to_cbor())
+        nothing = NodeDatum.fast_from_cbor(node_datum(OPERATOR).to_cbor())
+
+        assert price.node_state.ns_feed == PriceFeed(DataFeed(7, 1000))
+        assert isinstance(nothing.node_state.ns_feed, Nothing)
+
+    def test_known_layout_skips_generic_decoding(self, datum, monkeypatch):
+        monkeypatch.setattr(NodeDatum, "from_cbor", None)
+
+        assert NodeDatum.fast_from_cbor(datum.to_cbor()) == datum
+
+    @pytest.mark.parametrize(
+        "cbor",
+        [
+            agg_datum().to_cbor(),
+            cbor2.dumps(cbor2.CBORTag(122, [cbor2.CBORTag(121, [5, None])])),
+            cbor2.dumps(5),
+        ],
+        ids=["other datum", "int operator", "not a constructor"],
+    )
+    def test_unknown_layout_falls_back(self, cbor, monkeypatch):
+        seen = []
+        monkeypatch.setattr(
+            NodeDatum, "from_cbor", classmethod(lambda cls, raw: seen.append(raw))
+        )
+
+        NodeDatum.fast_from_cbor(cbor)
+
+        assert seen == [cbor]
+
+
+class TestPeekOperator:
+    def test_reads_operator(self, datum):
+        assert NodeDatum.peek_operator(datum.to_cbor()) == OPERATOR
+
+    @pytest.mark.parametrize(
+        "cbor",
+        [
+            agg_datum().to_cbor(),
+            cbor2.dumps(cbor2.CBORTag(122, [])),
+            cbor2.dumps(cbor2.CBORTag(122, [cbor2.CBORTag(121, [5, None])])),
+            cbor2.dumps(5),
+        ],
+        ids=["other datum", "no fields", "int operator", "not a constructor"],
+    )
+    def test_unknown_layout_returns_none(self, cbor):
+        assert NodeDatum.peek_operator(cbor) is None
+
+
+class TestAggDatumFastDecoding:
+    @pytest.mark.parametrize("node_list", [(), (OPERATOR,), (OPERATOR, b"b" * 28)])
+    def test_matches_generic_decoding(self, node_list):
+        cbor = agg_datum(node_list).to_cbor()
+
+        decoded = AggDatum.fast_from_cbor(cbor)
+
+        assert decoded == AggDatum.from_cbor(cbor)
+        assert decoded.to_cbor() == cbor
+
+    def test_returns_a_new_object_per_call(self):
+        cbor = agg_datum().to_cbor()
+
+        first = AggDatum.fast_from_cbor(cbor)
+        first.aggstate.ag_settings.os_node_list.append(b"c" * 28)
+        first.aggstate.ag_settings.os_node_fee_price.node_fee = 0
+
+        assert AggDatum.fast_from_cbor(cbor) == agg_datum()
+
+    def test_unknown_layout_falls_back(self, monkeypatch):
+        cbor = node_datum(OPERATOR).to_cbor()
+        seen = []
+        monkeypatch.setattr(
+            AggDatum, "from_cbor", classmethod(lambda cls, raw: seen.append(raw))
+        )
+
+        AggDatum.fast_from_cbor(cbor)
+
+        assert seen == [cbor]
@@ -0,0 +1,177 @@
+"""Offline tests for the node transactions."""
+
+from typing import List
+from unittest.mock import AsyncMock
+
+import pytest
+from pycardano import (
+    IndefiniteList,
+    PaymentSigningKey,
+    PaymentVerificationKey,
+    RawCBOR,
+    UTxO,
+)
+
+from charli3_offchain_core import node as node_module
+from charli3_offchain_core import oracle_checks
+from charli3_offchain_core.datums import (
+    AggDatum,
+    AggState,
+    OracleDatum,
+    OraclePlatform,
+    OracleReward,
+    OracleSettings,
+    PriceRewards,
+    RewardDatum,
+    RewardInfo,
+)
+from charli3_offchain_core.node import Node, _decode_reward_datum
+
+from .base import (
+    C3_NAME,
+    C3_POLICY,
+    NETWORK,
+    ORACLE_ADDR,
+    FakeBuilder,
+    c3,
+    make_chain_query,
+    make_utxo,
+    nft,
+    node_utxo,
+    reward_utxo,
+)
+
+SIGNING_KEYS = [PaymentSigningKey(bytes([i + 1]) * 32) for i in range(3)]
+VERIFICATION_KEYS = [
+    PaymentVerificationKey.from_primitive(key.to_verification_key().payload)
+    for key in SIGNING_KEYS
+]
+OPERATORS = [bytes(key.hash()) for key in VERIFICATION_KEYS]
+
+
+def oracle_utxos() -> List[UTxO]:
+    """Oracle UTxOs of three nodes that all updated recently."""
+    settings = OracleSettings(
+        os_node_list=IndefiniteList(list(OPERATORS)),
+        os_updated_nodes=6000,
+        os_updated_node_time=100000,
+        os_aggregate_time=1000,
+        os_aggregate_change=100,
+        os_minimum_deposit=1,
+        os_aggregate_valid_range=1,
+        os_node_fee_price=PriceRewards(node_fee=10, aggregate_fee=5, platform_fee=2),
+        os_iqr_multiplier=20000,
+        os_divergence=2000,
+        os_platform=OraclePlatform(IndefiniteList([b"p" * 28]), 1),
+    )
+    aggstate = AggDatum(AggState(settings))
+    return [
+        make_utxo(2, nft(b"AggState") + c3(1000), RawCBOR(aggstate.to_cbor())),
+        make_utxo(3, nft(b"OracleFeed"), RawCBOR(OracleDatum().to_cbor())),
+        reward_utxo(4, [RewardInfo(operator, 0) for operator in OPERATORS]),
+        *(node_utxo(10 + i, op, 100 + i) for i, op in enumerate(OPERATORS)),
+    ]
+
+
+@pytest.fixture
+def node(monkeypatch):
+    monkeypatch.setattr(node_module, "TransactionBuilder", FakeBuilder)
+    chain_query = make_chain_query(oracle_utxos(), utxo_cache_ttl_ms=2000)
+    chain_query.get_current_posix_chain_time_ms = lambda: 6000
+    return Node(
+        NETWORK,
+        chain_query,
+        SIGNING_KEYS[0],
+        VERIFICATION_KEYS[0],
+        nft(b"NodeFeed"),
+        nft(b"AggState"),
+        nft(b"OracleFeed"),
+        nft(b"Reward"),
+        ORACLE_ADDR,
+        C3_POLICY,
+        C3_NAME,
+    )
+
+
+def submitted_reward_datums(submit: AsyncMock) -> List[RewardDatum]:
+    """Reward datums of every transaction handed to the submitter."""
+    return [
+        output.datum
+        for call in submit.call_args_list
+        for output in call.args[0].outputs
+        if isinstance(output.datum, RewardDatum)
+    ]
+
+
+class TestRewardDatum:
+    async def test_failed_aggregate_does_not_change_cached_rewards(self, node):
+        submit = node.chain_query.submit_tx_builder = AsyncMock(
+            return_value=("insufficient funds", None)
+        )
+
+        utxos_query = node.chain_query.blockfrost_context.utxos
+        await node.aggregate()
+        queries = utxos_query.call_count
+        await node.aggregate()
+
+        # The second attempt reads the UTxOs cached by the first one.
+        assert utxos_query.call_count == queries
+        for datum in submitted_reward_datums(submit):
+            amounts = [r.reward_amount for r in datum.reward_state.node_reward_list]
+            assert amounts == [15, 10, 10]
+            assert datum.reward_state.platform_reward == 2
+
+    async def test_collect_after_failed_aggregate(self, node):
+        submit = node.chain_query.submit_tx_builder = AsyncMock(
+            return_value=("insufficient funds", None)
+        )
+
+        await node.aggregate()
+        await node.collect(node.address)
+
+        # The aggregation never reached the chain, so there is nothing to collect.
+        assert submit.call_count == 1
+
+
+class TestDecodeRewardDatum:
+    @pytest.mark.parametrize("container", [list, IndefiniteList])
+    def test_copies_decoded_datum(self, container):
+        rewards = container([RewardInfo(operator, 5) for operator in OPERATORS])
+        datum = RewardDatum(OracleReward(rewards, 3))
+        cbor = datum.to_cbor()
+
+        copy = _decode_reward_datum(datum)
+        copy.reward_state.node_reward_list[0].reward_amount = 0
+        copy.reward_state.platform_reward = 0
+
+        assert datum.to_cbor() == cbor
+        assert _decode_reward_datum(datum).to_cbor() == cbor
+
+    def test_decodes_raw_cbor(self):
+        datum = RewardDatum(OracleReward([RewardInfo(OPERATORS[0], 5)], 3))
+
+        assert _decode_reward_datum(RawCBOR(datum.to_cbor())) == datum
+
+    def test_no_datum(self):
+        assert _decode_reward_datum(None) is None
+
+
+class TestUpdate:
+    async def test_decodes_no_node_datums(self, node, monkeypatch):
+        submit = node.chain_query.submit_tx_builder = AsyncMock(
+            return_value=("success", None)
+        )
+        decoded = []
+        for module in (node_module, oracle_checks):
+            monkeypatch.setattr(module, "decode_node_datum", decoded.append)
+
+        await node.update(42)
+
+        (builder, *_), _ = submit.call_args
+        ((own_utxo, _),) = builder.inputs
+        (output,) = builder.outputs
+        assert not decoded
+        assert isinstance(own_utxo.output.datum, RawCBOR)
+        assert own_utxo.input == node_utxo(10, OPERATORS[0]).input
+        assert output.datum.node_state.ns_operator == OPERATORS[0]
+        assert output.datum.node_state.ns_feed.df.df_value == 42
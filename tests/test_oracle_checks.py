@@ -0,0 +1,121 @@
+"""Offline tests for the oracle UTxO helpers."""
+
+from pycardano import RawCBOR
+
+from charli3_offchain_core.datums import DataFeed, NodeDatum, OracleDatum, PriceFeed
+from charli3_offchain_core.oracle_checks import (
+    OracleUtxoIndex,
+    decode_node_datum,
+    partition_utxos_by_nft,
+)
+
+from .base import c3, make_utxo, nft, node_datum, node_utxo
+
+OPERATORS = [bytes([i]) * 28 for i in range(1, 4)]
+ORACLE_NFTS = {
+    "aggstate": nft(b"AggState"),
+    "oracle": nft(b"OracleFeed"),
+    "reward": nft(b"Reward"),
+    "node": nft(b"NodeFeed"),
+}
+
+
+def index_utxos(utxos) -> OracleUtxoIndex:
+    """Index the UTxOs by the test oracle NFTs."""
+    return OracleUtxoIndex.from_utxos(utxos, *ORACLE_NFTS.values())
+
+
+class TestDecodeNodeDatum:
+    def test_matches_generic_decoding(self):
+        cbor = node_datum(b"a" * 28, 42).to_cbor()
+
+        assert decode_node_datum(cbor) == NodeDatum.from_cbor(cbor)
+
+    def test_returns_a_new_object_per_call(self):
+        cbor = node_datum(b"a" * 28, 42).to_cbor()
+
+        first = decode_node_datum(cbor)
+        first.node_state.ns_feed.df.df_value = 7
+        first.node_state.ns_operator = b"b" * 28
+        second = decode_node_datum(cbor)
+
+        assert second is not first
+        assert second == node_datum(b"a" * 28, 42)
+
+    def test_replacing_the_feed_does_not_leak(self):
+        cbor = node_datum(b"a" * 28).to_cbor()
+
+        decode_node_datum(cbor).node_state.ns_feed = PriceFeed(DataFeed(1, 2))
+
+        assert decode_node_datum(cbor) == node_datum(b"a" * 28)
+
+
+class TestOracleUtxoIndex:
+    def test_classifies_by_nft(self):
+        aggstate = make_utxo(1, nft(b"AggState") + c3(100))
+        oraclefeed = make_utxo(2, nft(b"OracleFeed"), RawCBOR(OracleDatum().to_cbor()))
+        reward = make_utxo(3, nft(b"Reward"))
+        nodes = [node_utxo(10 + i, op, i) for i, op in enumerate(OPERATORS)]
+
+        index = index_utxos([make_utxo(4), *nodes, reward, oraclefeed, aggstate])
+
+        assert index.aggstate_utxo is aggstate
+        assert index.oraclefeed_utxo is oraclefeed
+        assert index.reward_utxo is reward
+        assert index.nodes_utxos == nodes
+        assert list(index.nodes_by_operator) == OPERATORS
+        assert index.nodes_by_operator[OPERATORS[1]] is nodes[1]
+
+    def test_decodes_node_datums(self):
+        raw = node_utxo(10, OPERATORS[0], 5)
+        decoded = node_utxo(11, OPERATORS[1], raw=False)
+        datum = decoded.output.datum
+
+        index = index_utxos([raw, decoded])
+
+        assert raw.output.datum == node_datum(OPERATORS[0], 5)
+        assert decoded.output.datum is datum
+        assert index.nodes_utxos == [raw, decoded]
+
+    def test_skips_node_utxos_without_datum(self):
+        index = index_utxos([make_utxo(10, nft(b"NodeFeed"))])
+
+        assert index.nodes_utxos == []
+        assert index.nodes_by_operator == {}
+
+    def test_missing_utxos_stay_none(self):
+        index = index_utxos([node_utxo(10, OPERATORS[0])])
+
+        assert index.aggstate_utxo is None
+        assert index.oraclefeed_utxo is None
+        assert index.reward_utxo is None
+
+
+class TestPartitionUtxosByNft:
+    def test_groups_by_nft(self):
+        nodes = [node_utxo(10 + i, op) for i, op in enumerate(OPERATORS)]
+        reward = make_utxo(3, nft(b"Reward") + c3(5))
+
+        groups = partition_utxos_by_nft(
+            [nodes[0], reward, make_utxo(4, c3(5)), *nodes[1:]], ORACLE_NFTS
+        )
+
+        assert groups == {
+            "aggstate": [],
+            "oracle": [],
+            "reward": [reward],
+            "node": nodes,
+        }
+
+    def test_first_matching_nft_wins(self):
+        both = make_utxo(1, nft(b"Reward") + nft(b"NodeFeed"))
+
+        groups = partition_utxos_by_nft([both], ORACLE_NFTS)
+
+        assert groups["reward"] == [both]
+        assert groups["node"] == []
+
+    def test_no_utxos(self):
+        assert partition_utxos_by_nft([], ORACLE_NFTS) == {
+            name: [] for name in ORACLE_NFTS
+        }
@@ -0,0 +1,134 @@
+"""Offline tests for the oracle owner transactions."""
+
+from unittest.mock import AsyncMock
+
+import pytest
+from pycardano import IndefiniteList, PaymentSigningKey, PaymentVerificationKey
+
+from charli3_offchain_core.datums import OracleReward, RewardDatum, RewardInfo
+from charli3_offchain_core.oracle_owner import OracleOwner, _pkhs_to_bytes
+
+from .base import (
+    C3_NAME,
+    C3_POLICY,
+    NETWORK,
+    NFT_POLICY,
+    ORACLE_ADDR,
+    make_chain_query,
+    make_utxo,
+    nft,
+)
+
+SIGNING_KEY = PaymentSigningKey(bytes([1]) * 32)
+VERIFICATION_KEY = PaymentVerificationKey.from_primitive(
+    SIGNING_KEY.to_verification_key().payload
+)
+SCRIPT_UTXO = make_utxo(1)
+
+
+def make_owner(reference_script_input=None) -> OracleOwner:
+    """Owner of the test oracle over a mocked chain query."""
+    chain_query = make_chain_query()
+    chain_query.get_reference_script_utxo = AsyncMock(return_value=SCRIPT_UTXO)
+    return OracleOwner(
+        NETWORK,
+        chain_query,
+        SIGNING_KEY,
+        VERIFICATION_KEY,
+        nft(b"NodeFeed"),
+        nft(b"AggState"),
+        nft(b"OracleFeed"),
+        nft(b"Reward"),
+        NFT_POLICY,
+        C3_POLICY,
+        C3_NAME,
+        str(ORACLE_ADDR),
+        None,
+        reference_script_input,
+    )
+
+
+@pytest.fixture
+def owner():
+    return make_owner(SCRIPT_UTXO.input)
+
+
+class TestScriptUtxo:
+    def test_none_until_loaded(self, owner):
+        assert owner.script_utxo is None
+
+    async def test_load_looks_up_once(self, owner):
+        assert await owner.load_script_utxo() is SCRIPT_UTXO
+        assert await owner.load_script_utxo() is SCRIPT_UTXO
+
+        assert owner.script_utxo is SCRIPT_UTXO
+        owner.chainquery.get_reference_script_utxo.assert_awaited_once()
+
+    async def test_assigned_utxo_skips_lookup(self, owner):
+        other = make_utxo(2)
+
+        owner.script_utxo = other
+
+        assert await owner.load_script_utxo() is other
+        owner.chainquery.get_reference_script_utxo.assert_not_awaited()
+
+    async def test_refresh_looks_up_again(self, owner):
+        await owner.load_script_utxo()
+        owner.refresh_reference_script()
+
+        assert owner.script_utxo is None
+        await owner.load_script_utxo()
+        assert owner.chainquery.get_reference_script_utxo.await_count == 2
+
+    async def test_without_reference_input(self):
+        owner = make_owner()
+
+        assert await owner.load_script_utxo() is None
+        owner.chainquery.get_reference_script_utxo.assert_not_awaited()
+
+
+class TestPkhsToBytes:
+    def test_accepts_hex_and_bytes(self):
+        pkh = bytes(range(28))
+
+        assert _pkhs_to_bytes([pkh.hex(), pkh, bytearray(pkh)]) == [pkh] * 3
+
+    @pytest.mark.parametrize(
+        "pkh", [bytes(27), bytes(29), "", bytes(32).hex()], ids=["27", "29", "0", "32"]
+    )
+    def test_rejects_wrong_length(self, pkh):
+        with pytest.raises(ValueError, match="Invalid verification key hash"):
+            _pkhs_to_bytes([bytes(28), pkh])
+
+    def test_rejects_invalid_hex(self):
+        with pytest.raises(ValueError):
+            _pkhs_to_bytes(["zz" * 28])
+
+
+class TestNodeOutputs:
+    def test_outputs_do_not_share_values_or_datums(self):
+        outputs = make_owner()._create_node_outputs([bytes(28), bytes([1]) * 28])
+
+        outputs[0].amount.coin += 1
+
+        assert outputs[1].amount.coin == 2000000
+        first, second = (output.datum.node_state.ns_feed for output in outputs)
+        assert first is not second
+
+
+class TestRemoveNodesFromRewardstate:
+    @pytest.mark.parametrize("container", [list, IndefiniteList])
+    def test_keeps_the_list_encoding(self, container):
+        nodes = [bytes([i]) * 28 for i in range(3)]
+        rewards = container([RewardInfo(node, i) for i, node in enumerate(nodes)])
+        cbor = RewardDatum(OracleReward(rewards, 0)).to_cbor()
+        datum = RewardDatum.from_cbor(cbor)
+
+        datum, removed, total = make_owner()._remove_nodes_from_rewardstate(
+            datum, nodes[1:]
+        )
+
+        expected = RewardDatum(OracleReward(container([RewardInfo(nodes[0], 0)]), 0))
+        assert datum.to_cbor() == expected.to_cbor()
+        assert [r.reward_address for r in removed] == nodes[1:]
+        assert total == 3